@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-from code_review_assistant.ai.provider import generate_llm_response
+from code_review_assistant.ai.provider import LLMReply, generate_llm_reply
 from code_review_assistant.config import Settings
 from code_review_assistant.models import ReviewReport
 
@@ -13,7 +13,7 @@ CHAT_SYSTEM_PROMPT = (
 )
 
 
-def ask_review_bot(settings: Settings, report: ReviewReport, question: str) -> str:
+def build_chat_prefix(report: ReviewReport) -> str:
     context = {
         "target": report.target,
         "total_findings": len(report.findings),
@@ -21,13 +21,44 @@ def ask_review_bot(settings: Settings, report: ReviewReport, question: str) -> s
         "ai_summary": report.ai_summary,
         "metadata": report.metadata,
     }
+    # Byte-identical across turns so local models can reuse the evaluated prefix;
+    # only the conversation history and the new question are appended after it.
+    serialized = json.dumps(context, sort_keys=True, separators=(",", ":"))
+    return f"{CHAT_SYSTEM_PROMPT}\n\nCode review context:\n{serialized}"
 
-    return generate_llm_response(
+
+def _question_prompt(question: str) -> str:
+    return f"Developer question: {question}"
+
+
+def _history_messages(history: list[dict] | None) -> list[dict]:
+    return [
+        {
+            "role": item["role"],
+            "content": _question_prompt(item["content"]) if item["role"] == "user" else item["content"],
+        }
+        for item in history or []
+    ]
+
+
+def ask_review_bot_reply(
+    settings: Settings,
+    report: ReviewReport,
+    question: str,
+    history: list[dict] | None = None,
+) -> LLMReply:
+    return generate_llm_reply(
         settings=settings,
-        system_prompt=CHAT_SYSTEM_PROMPT,
-        user_prompt=(
-            "Code review context:\n"
-            f"{json.dumps(context)}\n\n"
-            f"Developer question: {question}"
-        ),
+        system_prompt=build_chat_prefix(report),
+        user_prompt=_question_prompt(question),
+        history=_history_messages(history),
     )
+
+
+def ask_review_bot(
+    settings: Settings,
+    report: ReviewReport,
+    question: str,
+    history: list[dict] | None = None,
+) -> str:
+    return ask_review_bot_reply(settings, report, question, history=history).text
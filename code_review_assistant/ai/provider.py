@@ -1,63 +1,178 @@
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
 from openai import OpenAI
 
 from code_review_assistant.config import Settings
 
 
-def _openai_chat(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+LLM_ERROR_PREFIXES = (
+    "Ollama fallback unavailable.",
+    "Ollama request failed.",
+    "LLM_PROVIDER=openai selected but OPENAI_API_KEY is not configured.",
+)
+
+OLLAMA_UNAVAILABLE = (
+    "Ollama fallback unavailable. Install it with `pip install ollama` and run "
+    "`ollama serve`, then pull a model like `ollama pull llama3.1:8b`."
+)
+
+
+@dataclass
+class LLMReply:
+    text: str
+    provider: str
+    wall_seconds: float = 0.0
+    load_seconds: float | None = None
+    prompt_eval_seconds: float | None = None
+    prompt_tokens: int | None = None
+
+    def timing(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "load_seconds": None if self.load_seconds is None else round(self.load_seconds, 3),
+            "prompt_eval_seconds": (
+                None if self.prompt_eval_seconds is None else round(self.prompt_eval_seconds, 3)
+            ),
+            "prompt_tokens": self.prompt_tokens,
+        }
+
+
+def is_error_response(text: str) -> bool:
+    return text.startswith(LLM_ERROR_PREFIXES)
+
+
+def _messages(system_prompt: str, user_prompt: str, history: list[dict] | None) -> list[dict]:
+    return [
+        {"role": "system", "content": system_prompt},
+        *(history or []),
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _openai_chat(settings: Settings, messages: list[dict]) -> LLMReply:
+    started = time.perf_counter()
     client = OpenAI(api_key=settings.openai_api_key)
     response = client.responses.create(
         model=settings.openai_model,
-        input=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+        input=messages,
         temperature=0.2,
     )
-    return (response.output_text or "No response generated.").strip()
+    return LLMReply(
+        text=(response.output_text or "No response generated.").strip(),
+        provider="openai",
+        wall_seconds=time.perf_counter() - started,
+    )
+
+
+@lru_cache(maxsize=4)
+def _ollama_client(host: str) -> Any:
+    from ollama import Client
+
+    # One client per host keeps the HTTP connection to the server alive across turns.
+    return Client(host=host)
+
+
+def _keep_alive(settings: Settings) -> str | int:
+    # Ollama reads bare numbers as seconds (`-1` keeps the model loaded indefinitely).
+    value = settings.ollama_keep_alive.strip()
+    return int(value) if value.lstrip("-").isdigit() else value
+
 
+def _nanoseconds(value: Any) -> float | None:
+    return value / 1e9 if value is not None else None
 
-def _ollama_chat(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+
+def _ollama_chat(settings: Settings, messages: list[dict]) -> LLMReply:
+    started = time.perf_counter()
     try:
-        from ollama import Client
+        client = _ollama_client(settings.ollama_host)
     except ImportError:
-        return (
-            "Ollama fallback unavailable. Install it with `pip install ollama` and run "
-            "`ollama serve`, then pull a model like `ollama pull llama3.1:8b`."
-        )
+        return LLMReply(text=OLLAMA_UNAVAILABLE, provider="ollama")
 
-    client = Client(host=settings.ollama_host)
     try:
         response = client.chat(
             model=settings.ollama_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=messages,
             options={"temperature": 0.2},
+            keep_alive=_keep_alive(settings),
         )
     except Exception as exc:
-        return (
-            "Ollama request failed. Make sure the Ollama server is running (`ollama serve`) "
-            f"and model `{settings.ollama_model}` is pulled. Error: {exc}"
+        return LLMReply(
+            text=(
+                "Ollama request failed. Make sure the Ollama server is running (`ollama serve`) "
+                f"and model `{settings.ollama_model}` is pulled. Error: {exc}"
+            ),
+            provider="ollama",
+            wall_seconds=time.perf_counter() - started,
         )
 
-    return (response.get("message", {}) or {}).get("content", "No response generated.").strip()
+    return LLMReply(
+        text=(response.get("message", {}) or {}).get("content", "No response generated.").strip(),
+        provider="ollama",
+        wall_seconds=time.perf_counter() - started,
+        load_seconds=_nanoseconds(response.get("load_duration")),
+        prompt_eval_seconds=_nanoseconds(response.get("prompt_eval_duration")),
+        prompt_tokens=response.get("prompt_eval_count"),
+    )
 
 
-def generate_llm_response(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+def resolve_provider(settings: Settings) -> str:
     provider = (settings.llm_provider or "auto").lower()
+    if provider in {"openai", "ollama"}:
+        return provider
+    return "openai" if settings.openai_api_key else "ollama"
+
+
+def prewarm_ollama(settings: Settings) -> LLMReply:
+    started = time.perf_counter()
+    try:
+        client = _ollama_client(settings.ollama_host)
+    except ImportError:
+        return LLMReply(text=OLLAMA_UNAVAILABLE, provider="ollama")
+
+    try:
+        # An empty prompt only loads the model and pins it for the keep-alive window.
+        response = client.generate(model=settings.ollama_model, prompt="", keep_alive=_keep_alive(settings))
+    except Exception as exc:
+        return LLMReply(
+            text=f"Ollama request failed. Could not pre-warm `{settings.ollama_model}`. Error: {exc}",
+            provider="ollama",
+            wall_seconds=time.perf_counter() - started,
+        )
+
+    return LLMReply(
+        text="",
+        provider="ollama",
+        wall_seconds=time.perf_counter() - started,
+        load_seconds=_nanoseconds(response.get("load_duration")),
+    )
+
+
+def generate_llm_reply(
+    settings: Settings,
+    system_prompt: str,
+    user_prompt: str,
+    history: list[dict] | None = None,
+) -> LLMReply:
+    provider = resolve_provider(settings)
+    messages = _messages(system_prompt, user_prompt, history)
 
     if provider == "openai":
         if not settings.openai_api_key:
-            return "LLM_PROVIDER=openai selected but OPENAI_API_KEY is not configured."
-        return _openai_chat(settings, system_prompt, user_prompt)
+            return LLMReply(
+                text="LLM_PROVIDER=openai selected but OPENAI_API_KEY is not configured.",
+                provider="openai",
+            )
+        return _openai_chat(settings, messages)
 
-    if provider == "ollama":
-        return _ollama_chat(settings, system_prompt, user_prompt)
+    return _ollama_chat(settings, messages)
 
-    if settings.openai_api_key:
-        return _openai_chat(settings, system_prompt, user_prompt)
 
-    return _ollama_chat(settings, system_prompt, user_prompt)
+def generate_llm_response(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+    return generate_llm_reply(settings, system_prompt, user_prompt).text
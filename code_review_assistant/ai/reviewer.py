@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 
-from code_review_assistant.ai.provider import generate_llm_response
+from pathlib import Path
+from typing import Any
+
+from code_review_assistant.ai.provider import generate_llm_response, is_error_response, resolve_provider
+from code_review_assistant.ai.units import CodeUnit, UnitReviewCache, extract_units
 from code_review_assistant.config import Settings
 from code_review_assistant.models import Finding
 
@@ -13,6 +18,12 @@ SYSTEM_PROMPT = (
     "Respond with concise markdown bullet points and concrete fixes."
 )
 
+UNIT_SYSTEM_PROMPT = (
+    "You are a senior staff engineer reviewing a single Python function or class. "
+    "Focus on correctness, maintainability, performance, and security. "
+    "Respond with at most five concise markdown bullet points, or `- No issues.`"
+)
+
 
 def generate_ai_review(
     settings: Settings,
@@ -36,3 +47,112 @@ def generate_ai_review(
         system_prompt=SYSTEM_PROMPT,
         user_prompt=json.dumps(user_prompt),
     )
+
+
+UNIT_FINDINGS_LIMIT = 20
+
+
+def _review_unit(settings: Settings, unit: CodeUnit, findings: list[Finding]) -> str:
+    user_prompt = {
+        "unit": unit.label,
+        "findings": [f.to_dict() for f in findings[:UNIT_FINDINGS_LIMIT]],
+        "source": unit.source[:12000],
+    }
+    return generate_llm_response(
+        settings=settings,
+        system_prompt=UNIT_SYSTEM_PROMPT,
+        user_prompt=json.dumps(user_prompt),
+    )
+
+
+def _findings_digest(findings: list[Finding]) -> str:
+    payload = json.dumps([f.to_dict() for f in findings], sort_keys=True)
+    return "findings:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generate_unit_ai_review(
+    settings: Settings,
+    py_files: list[Path],
+    findings: list[Finding],
+    display_paths: dict[Path, str] | None = None,
+) -> tuple[str, dict[str, Any]]:
+    # Key on the model that actually answers; `auto` flips with OPENAI_API_KEY.
+    provider = resolve_provider(settings)
+    model = settings.openai_model if provider == "openai" else settings.ollama_model
+    namespace = f"{provider}:{model}"
+    cache = UnitReviewCache(settings.ai_cache_dir, namespace)
+    display_paths = display_paths or {}
+    units = [
+        unit
+        for py_file in py_files
+        for unit in extract_units(py_file, display_path=display_paths.get(py_file))
+    ]
+    if not units:
+        return generate_ai_review(settings=settings, findings=findings), {"ai_units_total": 0}
+
+    findings_by_file: dict[Path, list[Finding]] = {}
+    for finding in findings:
+        findings_by_file.setdefault(Path(finding.file_path).resolve(), []).append(finding)
+
+    comments: dict[str, str] = {}
+    pending: list[tuple[CodeUnit, list[Finding]]] = []
+    queued: set[str] = set()
+    # Findings outside every unit (module-level code) or past a unit's prompt limit
+    # still need a look, so they go to one repo-wide pass below.
+    leftover_ids = {id(finding) for finding in findings}
+    for unit in units:
+        file_findings = findings_by_file.get(Path(unit.file_path).resolve(), [])
+        unit_findings = [f for f in file_findings if unit.covers(f)]
+        leftover_ids.difference_update(id(f) for f in unit_findings[:UNIT_FINDINGS_LIMIT])
+
+        cached = comments.get(unit.digest) or cache.get(unit.digest)
+        if cached is not None:
+            comments[unit.digest] = cached
+        elif unit.digest not in queued:
+            queued.add(unit.digest)
+            pending.append((unit, unit_findings))
+    leftover = [finding for finding in findings if id(finding) in leftover_ids]
+
+    stats = {
+        "ai_units_total": len(units),
+        "ai_units_cached": len(units) - len(pending),
+        "ai_units_sent": 0,
+        "ai_units_deferred": len(pending),
+        "ai_findings_outside_units": len(leftover),
+    }
+
+    # Units with findings go first so the per-run budget is spent where it matters most.
+    error: str | None = None
+    pending.sort(key=lambda item: -len(item[1]))
+    for unit, unit_findings in pending[: max(settings.ai_max_units, 0)]:
+        comment = _review_unit(settings, unit, unit_findings)
+        if is_error_response(comment):
+            error = comment
+            break
+        cache.put(unit.digest, comment)
+        comments[unit.digest] = comment
+        stats["ai_units_sent"] += 1
+        stats["ai_units_deferred"] -= 1
+
+    sections: list[str] = []
+    for unit in units:
+        comment = comments.get(unit.digest)
+        if comment and comment.strip() != "- No issues.":
+            sections.append(f"### {unit.label}\n{comment}")
+
+    if leftover:
+        leftover_digest = _findings_digest(leftover)
+        overview = cache.get(leftover_digest)
+        if overview is None and error is None:
+            overview = generate_ai_review(settings=settings, findings=leftover)
+            if is_error_response(overview):
+                error, overview = overview, None
+            else:
+                cache.put(leftover_digest, overview)
+        if overview is not None:
+            sections.append(f"### Other findings\n{overview}")
+
+    summary = "\n\n".join(sections) or "No issues found in reviewed units."
+    if error is not None:
+        summary += f"\n\n> AI review stopped early; remaining units are retried on the next run. {error}"
+    return summary, stats
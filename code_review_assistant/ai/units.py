@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from code_review_assistant.models import Finding
+
+
+@dataclass
+class CodeUnit:
+    file_path: str
+    name: str
+    kind: str
+    line: int
+    end_line: int
+    source: str
+    digest: str
+    display_path: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.display_path or self.file_path}:{self.line} {self.kind} `{self.name}`"
+
+    def covers(self, finding: Finding) -> bool:
+        return finding.line is not None and self.line <= finding.line <= self.end_line
+
+
+def normalized_ast_digest(node: ast.AST) -> str:
+    # ast.dump drops comments and formatting; omitting attributes drops line numbers,
+    # so the digest only changes when the unit's code changes.
+    dumped = ast.dump(node, annotate_fields=False, include_attributes=False)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+
+
+def extract_units(py_file: Path, source: str | None = None, display_path: str | None = None) -> list[CodeUnit]:
+    if source is None:
+        source = py_file.read_text(encoding="utf-8")
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+
+    units: list[CodeUnit] = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        units.append(
+            CodeUnit(
+                file_path=str(py_file),
+                name=node.name,
+                kind="class" if isinstance(node, ast.ClassDef) else "function",
+                line=node.lineno,
+                end_line=node.end_lineno or node.lineno,
+                source=ast.get_source_segment(source, node) or "",
+                digest=normalized_ast_digest(node),
+                display_path=display_path,
+            )
+        )
+    return units
+
+
+class UnitReviewCache:
+    def __init__(self, root: str, namespace: str) -> None:
+        self.root = Path(root) / "ai_units"
+        self.namespace = namespace
+
+    def _path(self, digest: str) -> Path:
+        key = hashlib.sha256(f"{self.namespace}\0{digest}".encode("utf-8")).hexdigest()
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, digest: str) -> str | None:
+        path = self._path(digest)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))["comment"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, digest: str, comment: str) -> None:
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"comment": comment}), encoding="utf-8")
+        tmp_path.replace(path)
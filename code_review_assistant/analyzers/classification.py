@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from code_review_assistant.analyzers.complexity import run_complexity_many
+from code_review_assistant.analyzers.heuristics import analyze_python_file
+from code_review_assistant.analyzers.static import run_ruff_many
+from code_review_assistant.models import Finding
+
+
+HEADER_BYTES = 4096
+# Headers written by real generators, matched per `#` comment line.
+GENERATED_MARKERS = (
+    re.compile(rb"@generated\b"),
+    re.compile(rb"^Generated by the protocol buffer compiler\.\s+DO NOT EDIT!"),
+    re.compile(rb"^Code generated .+ DO NOT EDIT\.$"),
+)
+GENERATED_SUFFIXES = ("_pb2.py", "_pb2_grpc.py")
+
+POLICY_FULL = "full"
+POLICY_HEURISTICS = "heuristics"
+POLICY_SKIP = "skip"
+
+
+@dataclass
+class ClassificationPolicy:
+    max_full_bytes: int = 1_000_000
+    max_bytes: int = 5_000_000
+    skip_generated: bool = True
+
+
+@dataclass
+class FileClassification:
+    path: Path
+    size: int
+    digest: str
+    generated: bool
+    policy: str
+    reason: str | None = None
+
+
+@dataclass
+class ClassificationResult:
+    files: list[FileClassification] = field(default_factory=list)
+
+    def paths(self, policy: str) -> list[Path]:
+        return [item.path for item in self.files if item.policy == policy]
+
+    def summary(self) -> dict[str, Any]:
+        def total(policy: str) -> int:
+            return sum(item.size for item in self.files if item.policy == policy)
+
+        return {
+            "files_total": len(self.files),
+            "files_full": len(self.paths(POLICY_FULL)),
+            "files_heuristics_only": len(self.paths(POLICY_HEURISTICS)),
+            "files_skipped": len(self.paths(POLICY_SKIP)),
+            "bytes_total": sum(item.size for item in self.files),
+            "bytes_heuristics_only": total(POLICY_HEURISTICS),
+            "bytes_skipped": total(POLICY_SKIP),
+            "bytes_saved": total(POLICY_SKIP),
+            "downgraded": [
+                {"path": str(item.path), "policy": item.policy, "reason": item.reason, "bytes": item.size}
+                for item in self.files
+                if item.policy in {POLICY_HEURISTICS, POLICY_SKIP}
+            ][:100],
+        }
+
+
+def hash_file(path: Path, size: int) -> tuple[str, bytes]:
+    if size == 0:
+        return hashlib.sha256(b"").hexdigest(), b""
+
+    # Memory-mapped reads let hashlib stream the pages directly instead of
+    # materializing multi-MB generated modules as Python strings.
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        header = mapped[:HEADER_BYTES]
+        with memoryview(mapped) as view:
+            digest = hashlib.sha256(view).hexdigest()
+    return digest, header
+
+
+def _leading_comments(header: bytes) -> list[bytes]:
+    # Only the `#` comment block before the first statement counts; docstrings and
+    # code that merely mention a marker are never treated as generator headers.
+    comments: list[bytes] = []
+    for line in header.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not stripped.startswith(b"#"):
+            break
+        comments.append(stripped.lstrip(b"#").strip())
+    return comments
+
+
+def is_generated(path: Path, header: bytes) -> bool:
+    if path.name.endswith(GENERATED_SUFFIXES):
+        return True
+    return any(marker.search(comment) for comment in _leading_comments(header) for marker in GENERATED_MARKERS)
+
+
+def classify_files(files: list[Path], policy: ClassificationPolicy | None = None) -> ClassificationResult:
+    policy = policy or ClassificationPolicy()
+    result = ClassificationResult()
+
+    for path in files:
+        size = path.stat().st_size
+        digest, header = hash_file(path, size)
+        generated = is_generated(path, header)
+
+        if generated and policy.skip_generated:
+            decision, reason = POLICY_SKIP, "generated"
+        elif size > policy.max_bytes:
+            decision, reason = POLICY_SKIP, f"larger than {policy.max_bytes} bytes"
+        elif size > policy.max_full_bytes:
+            decision, reason = POLICY_HEURISTICS, f"larger than {policy.max_full_bytes} bytes"
+        else:
+            decision, reason = POLICY_FULL, None
+
+        result.files.append(FileClassification(path, size, digest, generated, decision, reason))
+
+    return result
+
+
+def analyze_files(full: list[Path], heuristics_only: list[Path], min_grade: str = "C") -> list[Finding]:
+    full_paths = [str(path) for path in full]
+    findings: list[Finding] = []
+    findings.extend(run_ruff_many(full_paths))
+    findings.extend(run_complexity_many(full_paths, min_grade=min_grade))
+    for path in [*full, *heuristics_only]:
+        findings.extend(analyze_python_file(path))
+    return findings
+
+
+def analyze_classified(classification: ClassificationResult, min_grade: str = "C") -> list[Finding]:
+    return analyze_files(
+        classification.paths(POLICY_FULL),
+        classification.paths(POLICY_HEURISTICS),
+        min_grade=min_grade,
+    )
+
+
+def merge_summaries(summaries: list[dict[str, Any]]) -> dict[str, Any]:
+    merged: dict[str, Any] = {"downgraded": []}
+    for summary in summaries:
+        for key, value in summary.items():
+            if key == "downgraded":
+                merged[key].extend(value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    merged["downgraded"] = merged["downgraded"][:100]
+    return merged
@@ -9,20 +9,33 @@ from pathlib import Path
 from code_review_assistant.models import Finding
 
 
+MAX_PATHS_PER_CALL = 500
+
+
 def run_complexity(path: str, min_grade: str = "C") -> list[Finding]:
     target = Path(path)
     if not target.exists():
         raise FileNotFoundError(f"Path not found: {path}")
+    return run_complexity_many([str(target)], min_grade=min_grade)
+
+
+def run_complexity_many(paths: list[str], min_grade: str = "C") -> list[Finding]:
+    findings: list[Finding] = []
+    for start in range(0, len(paths), MAX_PATHS_PER_CALL):
+        findings.extend(_run_complexity_chunk(paths[start : start + MAX_PATHS_PER_CALL], min_grade))
+    return findings
+
 
+def _run_complexity_chunk(paths: list[str], min_grade: str) -> list[Finding]:
     radon_bin = shutil.which("radon")
-    cmd = [radon_bin, "cc", "-j", "-s", str(target)] if radon_bin else [
+    cmd = [radon_bin, "cc", "-j", "-s", *paths] if radon_bin else [
         sys.executable,
         "-m",
         "radon",
         "cc",
         "-j",
         "-s",
-        str(target),
+        *paths,
     ]
     completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
@@ -61,7 +61,7 @@ class BugRiskVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def _python_files(path: str) -> list[Path]:
+def python_files(path: str) -> list[Path]:
     target = Path(path)
     if target.is_file() and target.suffix == ".py":
         return [target]
@@ -70,28 +70,30 @@ def _python_files(path: str) -> list[Path]:
     return []
 
 
-def run_bug_risk_heuristics(path: str) -> list[Finding]:
-    findings: list[Finding] = []
-    for py_file in _python_files(path):
-        source = py_file.read_text(encoding="utf-8")
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as exc:
-            findings.append(
-                Finding(
-                    tool="heuristic",
-                    file_path=str(py_file),
-                    line=exc.lineno,
-                    severity="high",
-                    message=f"Syntax error: {exc.msg}",
-                    suggestion="Fix syntax before running deeper analysis.",
-                    rule_id="HR000",
-                )
+def analyze_python_file(py_file: Path) -> list[Finding]:
+    source = py_file.read_text(encoding="utf-8")
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as exc:
+        return [
+            Finding(
+                tool="heuristic",
+                file_path=str(py_file),
+                line=exc.lineno,
+                severity="high",
+                message=f"Syntax error: {exc.msg}",
+                suggestion="Fix syntax before running deeper analysis.",
+                rule_id="HR000",
             )
-            continue
+        ]
+
+    visitor = BugRiskVisitor(str(py_file))
+    visitor.visit(tree)
+    return visitor.findings
 
-        visitor = BugRiskVisitor(str(py_file))
-        visitor.visit(tree)
-        findings.extend(visitor.findings)
 
+def run_bug_risk_heuristics(path: str) -> list[Finding]:
+    findings: list[Finding] = []
+    for py_file in python_files(path):
+        findings.extend(analyze_python_file(py_file))
     return findings
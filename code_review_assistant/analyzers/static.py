@@ -9,18 +9,33 @@ from pathlib import Path
 from code_review_assistant.models import Finding
 
 
+MAX_PATHS_PER_CALL = 500
+
+
 def run_ruff(path: str) -> list[Finding]:
     target = Path(path)
     if not target.exists():
         raise FileNotFoundError(f"Path not found: {path}")
+    return run_ruff_many([str(target)])
+
+
+def run_ruff_many(paths: list[str]) -> list[Finding]:
+    findings: list[Finding] = []
+    for start in range(0, len(paths), MAX_PATHS_PER_CALL):
+        findings.extend(_run_ruff_chunk(paths[start : start + MAX_PATHS_PER_CALL]))
+    return findings
+
 
+def _run_ruff_chunk(paths: list[str]) -> list[Finding]:
+    # --force-exclude keeps ruff's configured excludes in effect for explicit file lists.
     ruff_bin = shutil.which("ruff")
-    cmd = [ruff_bin, "check", str(target), "--output-format", "json"] if ruff_bin else [
+    cmd = [ruff_bin, "check", *paths, "--force-exclude", "--output-format", "json"] if ruff_bin else [
         sys.executable,
         "-m",
         "ruff",
         "check",
-        str(target),
+        *paths,
+        "--force-exclude",
         "--output-format",
         "json",
     ]
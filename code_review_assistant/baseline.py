@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from code_review_assistant.models import Finding
+
+
+BASELINE_MAGIC = b"CRAB"
+BASELINE_VERSION = 1
+_HEADER = struct.Struct("<4sHQ")
+
+
+class Baseline:
+    def __init__(self, fingerprints: frozenset[int] | None = None) -> None:
+        self.fingerprints = fingerprints or frozenset()
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self.fingerprints
+
+
+class _LineReader:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._cache: dict[str, list[str]] = {}
+
+    def relative_path(self, file_path: str) -> str:
+        path = Path(file_path)
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def line(self, file_path: str, lineno: int | None) -> str:
+        if not lineno:
+            return ""
+        if file_path not in self._cache:
+            try:
+                text = Path(file_path).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                text = ""
+            self._cache[file_path] = text.splitlines()
+        lines = self._cache[file_path]
+        if 0 < lineno <= len(lines):
+            return " ".join(lines[lineno - 1].split())
+        return ""
+
+
+def _baseline_root(target: str) -> Path:
+    path = Path(target).resolve()
+    return path.parent if path.is_file() else path
+
+
+def _finding_key(finding: Finding, reader: _LineReader) -> str:
+    return "\0".join(
+        [
+            finding.tool,
+            finding.rule_id or "",
+            reader.relative_path(finding.file_path),
+            reader.line(finding.file_path, finding.line),
+        ]
+    )
+
+
+def _fingerprint(key: str, occurrence: int) -> int:
+    digest = hashlib.blake2b(f"{key}\0{occurrence}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def fingerprint_findings(findings: list[Finding], target: str) -> list[int]:
+    # Identical lines in one file share a key, so each repeat is numbered in line
+    # order; a baseline then suppresses only as many repeats as it recorded.
+    reader = _LineReader(_baseline_root(target))
+    keys = [_finding_key(finding, reader) for finding in findings]
+    seen: dict[str, int] = {}
+    fingerprints = [0] * len(findings)
+    for index in sorted(range(len(findings)), key=lambda i: (findings[i].line or 0, i)):
+        occurrence = seen.get(keys[index], 0)
+        seen[keys[index]] = occurrence + 1
+        fingerprints[index] = _fingerprint(keys[index], occurrence)
+    return fingerprints
+
+
+def write_baseline(findings: list[Finding], target: str, baseline_path: str) -> int:
+    if array("Q").itemsize != 8:
+        raise RuntimeError("Unsupported platform: 64-bit array items are required for baselines.")
+    values = array("Q", sorted(set(fingerprint_findings(findings, target))))
+
+    path = Path(baseline_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(BASELINE_MAGIC, BASELINE_VERSION, len(values)))
+        if sys.byteorder != "little":
+            values.byteswap()
+        values.tofile(handle)
+    tmp_path.replace(path)
+    return len(values)
+
+
+def load_baseline(baseline_path: str) -> Baseline:
+    data = Path(baseline_path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Invalid baseline file: {baseline_path}")
+
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != BASELINE_MAGIC or version != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline file: {baseline_path}")
+    if len(data) - _HEADER.size != count * 8:
+        raise ValueError(f"Truncated baseline file: {baseline_path}")
+
+    values = array("Q")
+    values.frombytes(data[_HEADER.size :])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return Baseline(frozenset(values))
+
+
+def filter_new_findings(findings: list[Finding], target: str, baseline: Baseline) -> list[Finding]:
+    if not len(baseline):
+        return list(findings)
+    fingerprints = fingerprint_findings(findings, target)
+    return [finding for finding, fp in zip(findings, fingerprints) if fp not in baseline]
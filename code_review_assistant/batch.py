@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from code_review_assistant.ai.reviewer import generate_ai_review
+from code_review_assistant.config import Settings, get_settings
+from code_review_assistant.github.client import GitHubClient
+from code_review_assistant.models import ReviewReport
+from code_review_assistant.review_engine import build_pr_report
+
+
+T = TypeVar("T")
+
+@dataclass
+class PRReviewResult:
+    repo: str
+    pr_number: int
+    report: ReviewReport | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.report is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        severities = Counter(item.severity for item in self.report.findings) if self.report else Counter()
+        return {
+            "repo": self.repo,
+            "pr_number": self.pr_number,
+            "ok": self.ok,
+            "error": self.error,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "files_changed": (self.report.metadata.get("files_changed") if self.report else None),
+            "total_findings": len(self.report.findings) if self.report else 0,
+            "high": severities.get("high", 0),
+            "medium": severities.get("medium", 0),
+            "low": severities.get("low", 0),
+        }
+
+
+@dataclass
+class BatchReviewSummary:
+    results: list[PRReviewResult] = field(default_factory=list)
+    listing_errors: dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    github_concurrency: int = 0
+    llm_concurrency: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.listing_errors and all(item.ok for item in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_prs": len(self.results),
+            "succeeded": sum(1 for item in self.results if item.ok),
+            "failed": sum(1 for item in self.results if not item.ok),
+            "listing_errors": dict(self.listing_errors),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "github_concurrency": self.github_concurrency,
+            "llm_concurrency": self.llm_concurrency,
+            "results": [item.to_dict() for item in self.results],
+        }
+
+
+def parse_pr_ref(value: str) -> tuple[str, int]:
+    repo, sep, number = value.rpartition("#")
+    if not sep or "/" not in repo or not number.isdigit():
+        raise ValueError(f"Invalid PR reference `{value}`; expected owner/name#number")
+    return repo, int(number)
+
+
+async def _in_thread(executor: ThreadPoolExecutor, func: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args))
+
+
+async def _review_one(
+    settings: Settings,
+    gh: GitHubClient,
+    executor: ThreadPoolExecutor,
+    repo: str,
+    pr_number: int,
+    use_ai: bool,
+    github_limit: asyncio.Semaphore,
+    llm_limit: asyncio.Semaphore,
+) -> PRReviewResult:
+    started = time.perf_counter()
+    try:
+        async with github_limit:
+            files = await _in_thread(executor, gh.fetch_pr_files, repo, pr_number)
+
+        report = build_pr_report(repo, pr_number, files)
+
+        if use_ai:
+            async with llm_limit:
+                report.ai_summary = await _in_thread(executor, generate_ai_review, settings, [], files)
+    except Exception as exc:
+        return PRReviewResult(repo, pr_number, error=str(exc), elapsed_seconds=time.perf_counter() - started)
+
+    return PRReviewResult(repo, pr_number, report=report, elapsed_seconds=time.perf_counter() - started)
+
+
+async def _list_open(
+    gh: GitHubClient,
+    executor: ThreadPoolExecutor,
+    repo: str,
+    github_limit: asyncio.Semaphore,
+) -> tuple[list[tuple[str, int]], str | None]:
+    try:
+        async with github_limit:
+            numbers = await _in_thread(executor, gh.list_open_prs, repo)
+    except Exception as exc:
+        return [], str(exc)
+    return [(repo, number) for number in numbers], None
+
+
+async def review_github_prs_async(
+    pr_refs: list[tuple[str, int]],
+    repos: list[str] | None = None,
+    use_ai: bool = False,
+    github_concurrency: int = 8,
+    llm_concurrency: int = 4,
+) -> BatchReviewSummary:
+    if github_concurrency < 1 or llm_concurrency < 1:
+        raise ValueError("Concurrency limits must be at least 1.")
+
+    started = time.perf_counter()
+    settings = get_settings()
+    gh = GitHubClient(token=settings.github_token)
+    github_limit = asyncio.Semaphore(github_concurrency)
+    llm_limit = asyncio.Semaphore(llm_concurrency)
+    # Blocking HTTP calls run on a pool owned by this call, sized so the semaphores
+    # decide how much work is in flight; the caller's loop is left untouched.
+    executor = ThreadPoolExecutor(max_workers=github_concurrency + llm_concurrency)
+
+    try:
+        targets = list(pr_refs)
+        listing_errors: dict[str, str] = {}
+        repos = list(dict.fromkeys(repos or []))
+        listed = await asyncio.gather(*(_list_open(gh, executor, repo, github_limit) for repo in repos))
+        for repo, (repo_targets, error) in zip(repos, listed):
+            if error is not None:
+                listing_errors[repo] = error
+            targets.extend(repo_targets)
+        targets = list(dict.fromkeys(targets))
+
+        results = await asyncio.gather(
+            *(
+                _review_one(settings, gh, executor, repo, pr_number, use_ai, github_limit, llm_limit)
+                for repo, pr_number in targets
+            )
+        )
+    finally:
+        executor.shutdown(wait=False)
+
+    return BatchReviewSummary(
+        results=list(results),
+        listing_errors=listing_errors,
+        elapsed_seconds=time.perf_counter() - started,
+        github_concurrency=github_concurrency,
+        llm_concurrency=llm_concurrency,
+    )
+
+
+def review_github_prs(
+    pr_refs: list[tuple[str, int]],
+    repos: list[str] | None = None,
+    use_ai: bool = False,
+    github_concurrency: int = 8,
+    llm_concurrency: int = 4,
+) -> BatchReviewSummary:
+    return asyncio.run(
+        review_github_prs_async(
+            pr_refs=pr_refs,
+            repos=repos,
+            use_ai=use_ai,
+            github_concurrency=github_concurrency,
+            llm_concurrency=llm_concurrency,
+        )
+    )
+
+
+def report_filename(repo: str, pr_number: int, fmt: str) -> str:
+    extension = "json" if fmt == "json" else "md"
+    return f"{repo.replace('/', '__')}__pr{pr_number}.{extension}"
+
+
+def summary_to_json(summary: BatchReviewSummary) -> str:
+    return json.dumps(summary.to_dict(), indent=2)
+
+
+def summary_to_markdown(summary: BatchReviewSummary) -> str:
+    data = summary.to_dict()
+    lines: list[str] = []
+    lines.append("# Batch PR Review Summary")
+    lines.append("")
+    lines.append(f"- PRs reviewed: {data['total_prs']}")
+    lines.append(f"- Succeeded: {data['succeeded']}")
+    lines.append(f"- Failed: {data['failed']}")
+    lines.append(f"- Elapsed: {data['elapsed_seconds']}s")
+    lines.append(
+        f"- Concurrency: GitHub {data['github_concurrency']}, LLM {data['llm_concurrency']}"
+    )
+    if summary.listing_errors:
+        lines.append(f"- Repositories not listed: {len(summary.listing_errors)}")
+    lines.append("")
+    if summary.listing_errors:
+        lines.append("## Repository Listing Failures")
+        for repo, error in summary.listing_errors.items():
+            lines.append(f"- `{repo}`: {error}")
+        lines.append("")
+    lines.append("## Pull Requests")
+    if not summary.results:
+        lines.append("No pull requests reviewed.")
+    for item in data["results"]:
+        target = f"{item['repo']}#{item['pr_number']}"
+        if item["ok"]:
+            lines.append(
+                f"- `{target}`: {item['files_changed']} files changed, "
+                f"{item['total_findings']} findings (high {item['high']}, medium {item['medium']}, "
+                f"low {item['low']}) in {item['elapsed_seconds']}s"
+            )
+        else:
+            lines.append(f"- `{target}`: FAILED - {item['error']}")
+
+    return "\n".join(lines).strip() + "\n"
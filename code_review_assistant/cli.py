@@ -4,18 +4,34 @@ import argparse
 import sys
 from pathlib import Path
 
+from code_review_assistant.ai.provider import prewarm_ollama
+from code_review_assistant.analyzers.classification import ClassificationPolicy
+from code_review_assistant.batch import (
+    BatchReviewSummary,
+    parse_pr_ref,
+    report_filename,
+    review_github_prs,
+    summary_to_json,
+    summary_to_markdown,
+)
+from code_review_assistant.config import get_settings
+from code_review_assistant.distributed import run_worker
 from code_review_assistant.models import ReviewReport
+from code_review_assistant.reporting.binary import BINARY_EXTENSION, read_report, write_binary_report
 from code_review_assistant.reporting.formatter import to_json, to_markdown
 from code_review_assistant.review_engine import review_github_pr, review_local_path
 
 
+REPORT_FORMATS = ["markdown", "json", "binary"]
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="AI-Powered Code Review Assistant")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     local_cmd = subparsers.add_parser("review-path", help="Review local files")
     local_cmd.add_argument("--path", default=".", help="File or folder to review")
-    local_cmd.add_argument("--format", choices=["markdown", "json"], default="markdown")
+    local_cmd.add_argument("--format", choices=REPORT_FORMATS, default="markdown")
     local_cmd.add_argument("--output", help="Optional output report path")
     local_cmd.add_argument("--use-ai", action="store_true", help="Enable OpenAI review summary")
     local_cmd.add_argument(
@@ -24,14 +40,77 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["A", "B", "C", "D", "E", "F"],
         help="Minimum complexity rank to include",
     )
+    local_cmd.add_argument("--baseline", help="Baseline fingerprint file; only new findings are reported")
+    local_cmd.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record all current findings into --baseline instead of filtering",
+    )
+    local_cmd.add_argument(
+        "--max-full-analysis-bytes",
+        type=int,
+        default=1_000_000,
+        help="Files larger than this get bug-risk heuristics only (no ruff/radon)",
+    )
+    local_cmd.add_argument("--max-file-bytes", type=int, default=5_000_000, help="Skip files larger than this")
+    local_cmd.add_argument(
+        "--include-generated",
+        action="store_true",
+        help="Analyze files with generated-code markers instead of skipping them",
+    )
+    local_cmd.add_argument("--workers", type=int, default=1, help="Parallel analysis processes (cost-scheduled)")
+    local_cmd.add_argument("--queue", help="Shared SQLite work queue; shards the review across workers")
+    local_cmd.add_argument("--shard-size", type=int, default=50, help="Files per shard when using --queue")
+    local_cmd.add_argument("--lease-seconds", type=float, default=300.0, help="Shard lease before reclaim")
+
+    worker_cmd = subparsers.add_parser("worker", help="Process shards from a shared work queue")
+    worker_cmd.add_argument("--queue", required=True, help="Shared SQLite work queue path")
+    worker_cmd.add_argument("--root", help="Local mount of the reviewed tree if it differs from the coordinator's")
+    worker_cmd.add_argument("--worker-id", help="Worker name (default: hostname:pid)")
+    worker_cmd.add_argument("--lease-seconds", type=float, default=300.0, help="Shard lease before reclaim")
+    worker_cmd.add_argument("--poll-interval", type=float, default=2.0, help="Seconds between empty-queue polls")
+    worker_cmd.add_argument("--idle-exit", type=float, help="Exit after this many idle seconds")
 
     pr_cmd = subparsers.add_parser("review-pr", help="Review a GitHub pull request")
     pr_cmd.add_argument("--repo", required=True, help="Repo in owner/name format")
     pr_cmd.add_argument("--pr-number", type=int, required=True, help="Pull request number")
-    pr_cmd.add_argument("--format", choices=["markdown", "json"], default="markdown")
+    pr_cmd.add_argument("--format", choices=REPORT_FORMATS, default="markdown")
     pr_cmd.add_argument("--output", help="Optional output report path")
     pr_cmd.add_argument("--use-ai", action="store_true", help="Enable OpenAI review summary")
 
+    batch_cmd = subparsers.add_parser("review-prs", help="Review many GitHub pull requests concurrently")
+    batch_cmd.add_argument(
+        "--pr",
+        action="append",
+        default=[],
+        help="PR in owner/name#number format (repeatable)",
+    )
+    batch_cmd.add_argument(
+        "--repo",
+        action="append",
+        default=[],
+        help="Review all open PRs in owner/name (repeatable)",
+    )
+    batch_cmd.add_argument("--format", choices=["markdown", "json"], default="markdown")
+    batch_cmd.add_argument("--output-dir", default="reports/batch", help="Directory for per-PR reports")
+    batch_cmd.add_argument("--use-ai", action="store_true", help="Enable OpenAI review summary")
+    batch_cmd.add_argument("--github-concurrency", type=int, default=8, help="Max concurrent GitHub requests")
+    batch_cmd.add_argument("--llm-concurrency", type=int, default=4, help="Max concurrent LLM requests")
+
+    subparsers.add_parser(
+        "warm-model",
+        help="Load the Ollama model and keep it resident for OLLAMA_KEEP_ALIVE",
+    )
+
+    convert_cmd = subparsers.add_parser("convert", help="Convert a report between JSON, binary and markdown")
+    convert_cmd.add_argument("--input", required=True, help="JSON or binary report to read")
+    convert_cmd.add_argument("--output", required=True, help="Report path to write")
+    convert_cmd.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        help=f"Output format (default: from --output extension, `{BINARY_EXTENSION}` is binary)",
+    )
+
     return parser
 
 
@@ -40,6 +119,17 @@ def review_path(args: argparse.Namespace) -> ReviewReport:
         path=args.path,
         complexity_threshold=args.complexity_threshold,
         use_ai=args.use_ai,
+        baseline_path=args.baseline,
+        update_baseline=args.update_baseline,
+        queue_path=args.queue,
+        shard_size=args.shard_size,
+        lease_seconds=args.lease_seconds,
+        workers=args.workers,
+        classification_policy=ClassificationPolicy(
+            max_full_bytes=args.max_full_analysis_bytes,
+            max_bytes=args.max_file_bytes,
+            skip_generated=not args.include_generated,
+        ),
     )
 
 
@@ -47,12 +137,59 @@ def review_pr(args: argparse.Namespace) -> ReviewReport:
     return review_github_pr(repo=args.repo, pr_number=args.pr_number, use_ai=args.use_ai)
 
 
+def review_prs(args: argparse.Namespace) -> BatchReviewSummary:
+    return review_github_prs(
+        pr_refs=[parse_pr_ref(value) for value in args.pr],
+        repos=args.repo,
+        use_ai=args.use_ai,
+        github_concurrency=args.github_concurrency,
+        llm_concurrency=args.llm_concurrency,
+    )
+
+
+def write_batch_outputs(summary: BatchReviewSummary, fmt: str, output_dir: str) -> str:
+    for result in summary.results:
+        if result.report is not None:
+            maybe_write_output(
+                render_report(result.report, fmt),
+                str(Path(output_dir) / report_filename(result.repo, result.pr_number, fmt)),
+            )
+
+    if fmt == "json":
+        content = summary_to_json(summary)
+        maybe_write_output(content, str(Path(output_dir) / "summary.json"))
+    else:
+        content = summary_to_markdown(summary)
+        maybe_write_output(content, str(Path(output_dir) / "summary.md"))
+    return content
+
+
 def render_report(report: ReviewReport, fmt: str) -> str:
     if fmt == "json":
         return to_json(report)
     return to_markdown(report)
 
 
+def infer_format(output_path: str) -> str:
+    suffix = Path(output_path).suffix.lower()
+    if suffix == BINARY_EXTENSION:
+        return "binary"
+    if suffix == ".json":
+        return "json"
+    return "markdown"
+
+
+def emit_report(report: ReviewReport, fmt: str, output_path: str | None) -> None:
+    if fmt == "binary":
+        write_binary_report(report, output_path)
+        print(f"Wrote binary report with {len(report.findings)} findings to {output_path}")
+        return
+
+    output = render_report(report, fmt)
+    print(output)
+    maybe_write_output(output, output_path)
+
+
 def maybe_write_output(content: str, output_path: str | None) -> None:
     if not output_path:
         return
@@ -65,6 +202,68 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if getattr(args, "update_baseline", False) and not args.baseline:
+        parser.error("--update-baseline requires --baseline")
+
+    if args.command == "review-path" and args.queue and args.workers > 1:
+        parser.error("--workers cannot be combined with --queue; start extra `worker` processes instead")
+
+    if args.command in {"review-path", "review-pr"} and args.format == "binary" and not args.output:
+        parser.error("--format binary requires --output")
+
+    if args.command == "warm-model":
+        settings = get_settings()
+        warm = prewarm_ollama(settings)
+        if warm.text:
+            print(f"Error: {warm.text}", file=sys.stderr)
+            return 1
+        print(
+            f"Model `{settings.ollama_model}` ready in {warm.wall_seconds:.2f}s; "
+            f"kept alive for {settings.ollama_keep_alive}."
+        )
+        return 0
+
+    if args.command == "convert":
+        try:
+            report = read_report(args.input)
+            fmt = args.format or infer_format(args.output)
+            if fmt == "binary":
+                write_binary_report(report, args.output)
+            else:
+                maybe_write_output(render_report(report, fmt), args.output)
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(f"Converted {args.input} to {fmt} at {args.output}")
+        return 0
+
+    if args.command == "worker":
+        try:
+            processed = run_worker(
+                queue_path=args.queue,
+                worker=args.worker_id,
+                root=args.root,
+                lease_seconds=args.lease_seconds,
+                poll_interval=args.poll_interval,
+                idle_exit=args.idle_exit,
+            )
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(f"Processed {processed} shards.")
+        return 0
+
+    if args.command == "review-prs":
+        if not args.pr and not args.repo:
+            parser.error("review-prs requires at least one --pr or --repo")
+        try:
+            summary = review_prs(args)
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(write_batch_outputs(summary, args.format, args.output_dir))
+        return 0 if summary.ok else 1
+
     try:
         if args.command == "review-path":
             report = review_path(args)
@@ -77,9 +276,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    output = render_report(report, args.format)
-    print(output)
-    maybe_write_output(output, args.output)
+    emit_report(report, args.format, args.output)
     return 0
 
 
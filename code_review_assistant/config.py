@@ -16,7 +16,12 @@ class Settings:
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     ollama_host: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
     ollama_model: str = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+    ollama_keep_alive: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+    ollama_prewarm: bool = os.getenv("OLLAMA_PREWARM", "false").lower() in {"1", "true", "yes"}
     github_token: str | None = os.getenv("GITHUB_TOKEN")
+    ai_cache_dir: str = os.getenv("AI_CACHE_DIR", ".code_review_cache")
+    ai_max_units: int = int(os.getenv("AI_MAX_UNITS", "40"))
+    analysis_history_path: str = os.getenv("ANALYSIS_HISTORY_PATH", ".code_review_cache/analysis_times.json")
 
 
 def get_settings() -> Settings:
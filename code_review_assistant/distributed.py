@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from code_review_assistant.analyzers.classification import (
+    ClassificationPolicy,
+    analyze_classified,
+    classify_files,
+    merge_summaries,
+)
+from code_review_assistant.analyzers.heuristics import python_files
+from code_review_assistant.models import Finding
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    complexity_threshold TEXT NOT NULL,
+    policy TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS shards (
+    job_id TEXT NOT NULL,
+    shard_id INTEGER NOT NULL,
+    files TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (job_id, shard_id)
+);
+CREATE INDEX IF NOT EXISTS shards_by_status ON shards (status, lease_expires);
+"""
+
+
+@dataclass
+class ShardClaim:
+    job_id: str
+    shard_id: int
+    root: str
+    complexity_threshold: str
+    files: list[str]
+    policy: dict[str, Any] = field(default_factory=dict)
+
+
+class WorkQueue:
+    def __init__(self, db_path: str, lease_seconds: float = 300.0, max_attempts: int = 3) -> None:
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 60000")
+        return conn
+
+    def _expire_exhausted(self, conn: sqlite3.Connection, now: float) -> None:
+        # Expired leases are reclaimed by the next claim unless the shard already
+        # crashed its workers too many times.
+        conn.execute(
+            "UPDATE shards SET status = 'failed', error = COALESCE(error, 'lease expired') "
+            "WHERE status = 'claimed' AND lease_expires < ? AND attempts >= ?",
+            (now, self.max_attempts),
+        )
+
+    def create_job(
+        self,
+        root: str,
+        complexity_threshold: str,
+        shards: list[list[str]],
+        policy: dict[str, Any] | None = None,
+    ) -> str:
+        job_id = uuid.uuid4().hex
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT INTO jobs (job_id, root, complexity_threshold, policy, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, root, complexity_threshold, json.dumps(policy or {}), time.time()),
+            )
+            conn.executemany(
+                "INSERT INTO shards (job_id, shard_id, files) VALUES (?, ?, ?)",
+                [(job_id, index, json.dumps(files)) for index, files in enumerate(shards)],
+            )
+            conn.execute("COMMIT")
+        return job_id
+
+    def claim(self, worker: str, job_id: str | None = None) -> ShardClaim | None:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_exhausted(conn, now)
+            query = (
+                "SELECT s.job_id, s.shard_id, s.files, j.root, j.complexity_threshold, j.policy FROM shards s "
+                "JOIN jobs j ON j.job_id = s.job_id "
+                "WHERE (s.status = 'pending' OR (s.status = 'claimed' AND s.lease_expires < ?))"
+            )
+            params: list = [now]
+            if job_id:
+                query += " AND s.job_id = ?"
+                params.append(job_id)
+            row = conn.execute(query + " ORDER BY j.created_at, s.shard_id LIMIT 1", params).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE shards SET status = 'claimed', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE job_id = ? AND shard_id = ?",
+                (worker, now + self.lease_seconds, row[0], row[1]),
+            )
+            conn.execute("COMMIT")
+
+        return ShardClaim(
+            job_id=row[0],
+            shard_id=row[1],
+            root=row[3],
+            complexity_threshold=row[4],
+            files=json.loads(row[2]),
+            policy=json.loads(row[5]),
+        )
+
+    def renew(self, claim: ShardClaim, worker: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE shards SET lease_expires = ? "
+                "WHERE job_id = ? AND shard_id = ? AND worker = ? AND status = 'claimed'",
+                (time.time() + self.lease_seconds, claim.job_id, claim.shard_id, worker),
+            )
+
+    def complete(
+        self,
+        claim: ShardClaim,
+        worker: str,
+        findings: list[Finding],
+        classification: dict[str, Any] | None = None,
+    ) -> bool:
+        payload = json.dumps(
+            {"findings": [item.to_dict() for item in findings], "classification": classification or {}}
+        )
+        # Like `fail`, only the current lease owner may settle the shard.
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE shards SET status = 'done', result = ?, error = NULL "
+                "WHERE job_id = ? AND shard_id = ? AND worker = ? AND status = 'claimed'",
+                (payload, claim.job_id, claim.shard_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, claim: ShardClaim, worker: str, error: str) -> None:
+        # A worker whose lease was reclaimed must not reset the new owner's claim.
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE shards SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "worker = NULL, lease_expires = NULL, error = ? "
+                "WHERE job_id = ? AND shard_id = ? AND worker = ? AND status = 'claimed'",
+                (self.max_attempts, error, claim.job_id, claim.shard_id, worker),
+            )
+
+    def progress(self, job_id: str) -> dict[str, int]:
+        with closing(self._connect()) as conn:
+            self._expire_exhausted(conn, time.time())
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM shards WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def results(self, job_id: str) -> tuple[list[Finding], list[dict[str, Any]], list[str]]:
+        findings: list[Finding] = []
+        classifications: list[dict[str, Any]] = []
+        errors: list[str] = []
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT shard_id, status, result, error FROM shards WHERE job_id = ? ORDER BY shard_id",
+                (job_id,),
+            ).fetchall()
+        for shard_id, status, result, error in rows:
+            if status == "done":
+                payload = json.loads(result)
+                findings.extend(Finding(**item) for item in payload["findings"])
+                if payload["classification"]:
+                    classifications.append(payload["classification"])
+            else:
+                errors.append(f"shard {shard_id}: {error or status}")
+        return findings, classifications, errors
+
+    def delete_job(self, job_id: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM shards WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            conn.execute("COMMIT")
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _relative_path(path: str, root: Path) -> str:
+    try:
+        return Path(path).resolve().relative_to(root).as_posix()
+    except ValueError:
+        return path
+
+
+@contextmanager
+def _lease_heartbeat(queue: WorkQueue, claim: ShardClaim, worker: str) -> Iterator[None]:
+    # Keep renewing while the shard is analyzed so a slow but live worker is not
+    # mistaken for a crashed one and its shard reclaimed.
+    stop = threading.Event()
+    interval = max(queue.lease_seconds / 3, 0.01)
+
+    def beat() -> None:
+        while not stop.wait(interval):
+            queue.renew(claim, worker)
+
+    thread = threading.Thread(target=beat, name=f"lease-{claim.job_id}-{claim.shard_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def analyze_shard(
+    queue: WorkQueue,
+    claim: ShardClaim,
+    worker: str,
+    root: str | None = None,
+) -> tuple[list[Finding], dict[str, Any]]:
+    base = Path(root or claim.root).resolve()
+    with _lease_heartbeat(queue, claim, worker):
+        classification = classify_files([base / rel for rel in claim.files], ClassificationPolicy(**claim.policy))
+        findings = analyze_classified(classification, min_grade=claim.complexity_threshold)
+
+    # Workers may mount the tree elsewhere; the coordinator re-roots these paths.
+    for finding in findings:
+        finding.file_path = _relative_path(finding.file_path, base)
+    summary = classification.summary()
+    for item in summary["downgraded"]:
+        item["path"] = _relative_path(item["path"], base)
+    return findings, summary
+
+
+def process_one(queue: WorkQueue, worker: str, job_id: str | None = None, root: str | None = None) -> bool:
+    claim = queue.claim(worker, job_id=job_id)
+    if claim is None:
+        return False
+    try:
+        findings, classification = analyze_shard(queue, claim, worker, root=root)
+    except Exception as exc:
+        queue.fail(claim, worker, f"{worker}: {exc}")
+    else:
+        queue.complete(claim, worker, findings, classification)
+    return True
+
+
+def run_worker(
+    queue_path: str,
+    worker: str | None = None,
+    root: str | None = None,
+    lease_seconds: float = 300.0,
+    poll_interval: float = 2.0,
+    idle_exit: float | None = None,
+) -> int:
+    queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    worker = worker or default_worker_id()
+    processed = 0
+    idle_since = time.monotonic()
+    while True:
+        if process_one(queue, worker, root=root):
+            processed += 1
+            idle_since = time.monotonic()
+            continue
+        if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+            return processed
+        time.sleep(poll_interval)
+
+
+def shard_files(files: list[Path], root: Path, shard_size: int) -> list[list[str]]:
+    relative = sorted(path.resolve().relative_to(root).as_posix() for path in files)
+    return [relative[index : index + shard_size] for index in range(0, len(relative), shard_size)]
+
+
+def review_sharded(
+    path: str,
+    queue_path: str,
+    complexity_threshold: str = "C",
+    shard_size: int = 50,
+    lease_seconds: float = 300.0,
+    poll_interval: float = 2.0,
+    participate: bool = True,
+    classification_policy: ClassificationPolicy | None = None,
+) -> tuple[list[Finding], dict[str, Any]]:
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1.")
+
+    target = Path(path).resolve()
+    if not target.exists():
+        raise FileNotFoundError(f"Path not found: {path}")
+    root = target.parent if target.is_file() else target
+
+    queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    shards = shard_files(python_files(str(target)), root, shard_size)
+    policy = asdict(classification_policy or ClassificationPolicy())
+    job_id = queue.create_job(str(root), complexity_threshold, shards, policy=policy)
+    worker = f"coordinator:{default_worker_id()}"
+
+    try:
+        while True:
+            progress = queue.progress(job_id)
+            if progress.get("pending", 0) + progress.get("claimed", 0) == 0:
+                break
+            if not (participate and process_one(queue, worker, job_id=job_id)):
+                time.sleep(poll_interval)
+
+        findings, classifications, errors = queue.results(job_id)
+        if errors:
+            raise RuntimeError("Sharded review failed: " + "; ".join(errors[:5]))
+    finally:
+        queue.delete_job(job_id)
+
+    for finding in findings:
+        finding.file_path = str(root / finding.file_path)
+    classification = merge_summaries(classifications)
+    for item in classification["downgraded"]:
+        item["path"] = str(root / item["path"])
+    return findings, {"shards": len(shards), "shard_size": shard_size, "classification": classification}
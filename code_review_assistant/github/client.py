@@ -33,3 +33,27 @@ class GitHubClient:
             }
             for item in files
         ]
+
+    def fetch_pr_head_sha(self, repo: str, pr_number: int) -> str:
+        url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
+        resp = requests.get(url, headers=self._headers(), timeout=30)
+        resp.raise_for_status()
+        return (resp.json().get("head") or {}).get("sha", "")
+
+    def list_open_prs(self, repo: str) -> list[int]:
+        url = f"https://api.github.com/repos/{repo}/pulls"
+        numbers: list[int] = []
+        page = 1
+        while True:
+            resp = requests.get(
+                url,
+                headers=self._headers(),
+                params={"state": "open", "per_page": 100, "page": page},
+                timeout=30,
+            )
+            resp.raise_for_status()
+            items = resp.json()
+            numbers.extend(item["number"] for item in items if "number" in item)
+            if len(items) < 100:
+                return numbers
+            page += 1
@@ -36,3 +36,12 @@ class ReviewReport:
             "ai_summary": self.ai_summary,
             "metadata": self.metadata,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ReviewReport:
+        return cls(
+            target=data.get("target", ""),
+            findings=[Finding(**item) for item in data.get("findings", [])],
+            ai_summary=data.get("ai_summary"),
+            metadata=data.get("metadata") or {},
+        )
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from code_review_assistant.models import Finding, ReviewReport
+from code_review_assistant.reporting.formatter import from_json
+
+
+# Layout (little-endian, sections 8-byte aligned):
+#   header   magic, version, then offset/length of each section below
+#   meta     JSON: target, ai_summary, metadata and severity/tool/rule counts
+#   strings  u64 offsets[count + 1] followed by one UTF-8 blob
+#   files    (path string, first row, row count) per file, rows grouped by file
+#   columns  file, line, severity, tool, message, suggestion, rule, order (u32/i32 per row)
+#            `order` is each row's position in the original findings list
+BINARY_MAGIC = b"CRRB"
+BINARY_VERSION = 1
+BINARY_EXTENSION = ".crr"
+_HEADER = struct.Struct("<4sHHQQQIQIQQ")
+_FILE_ENTRY = struct.Struct("<III")
+_FINDING_COLUMNS = ("file", "line", "severity", "tool", "message", "suggestion", "rule")
+_COLUMNS = (*_FINDING_COLUMNS, "order")
+_NONE = 0xFFFFFFFF
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return _NONE
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def to_bytes(self) -> bytes:
+        encoded = [value.encode("utf-8") for value in self.values]
+        offsets = [0]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        return struct.pack(f"<{len(offsets)}Q", *offsets) + b"".join(encoded)
+
+
+def _pad(chunk: bytes) -> bytes:
+    return chunk + b"\0" * (-len(chunk) % 8)
+
+
+def is_binary_report(content: bytes) -> bool:
+    return content[:4] == BINARY_MAGIC
+
+
+def to_binary(report: ReviewReport) -> bytes:
+    grouped: dict[str, list[tuple[int, Finding]]] = {}
+    for position, item in enumerate(report.findings):
+        grouped.setdefault(item.file_path, []).append((position, item))
+
+    strings = _StringTable()
+    columns: dict[str, list[int]] = {name: [] for name in _COLUMNS}
+    file_entries: list[bytes] = []
+    for file_path, items in grouped.items():
+        file_index = strings.add(file_path)
+        file_entries.append(_FILE_ENTRY.pack(file_index, len(columns["file"]), len(items)))
+        for position, item in items:
+            columns["file"].append(file_index)
+            columns["line"].append(item.line if item.line is not None else -1)
+            columns["severity"].append(strings.add(item.severity))
+            columns["tool"].append(strings.add(item.tool))
+            columns["message"].append(strings.add(item.message))
+            columns["suggestion"].append(strings.add(item.suggestion))
+            columns["rule"].append(strings.add(item.rule_id))
+            columns["order"].append(position)
+
+    meta = {
+        "target": report.target,
+        "ai_summary": report.ai_summary,
+        "metadata": report.metadata,
+        "total_findings": len(report.findings),
+        "severity_counts": dict(Counter(item.severity for item in report.findings)),
+        "tool_counts": dict(Counter(item.tool for item in report.findings)),
+        "rule_counts": dict(Counter(item.rule_id or "" for item in report.findings)),
+    }
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    row_count = len(report.findings)
+    sections = [
+        _pad(meta_bytes),
+        _pad(strings.to_bytes()),
+        _pad(b"".join(file_entries)),
+        _pad(
+            b"".join(
+                struct.pack(f"<{row_count}{'i' if name == 'line' else 'I'}", *columns[name])
+                for name in _COLUMNS
+            )
+        ),
+    ]
+
+    offset = _HEADER.size + (-_HEADER.size % 8)
+    offsets = []
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+
+    header = _HEADER.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        0,
+        offsets[0],
+        len(meta_bytes),
+        offsets[1],
+        len(strings.values),
+        offsets[2],
+        len(file_entries),
+        offsets[3],
+        row_count,
+    )
+    return _pad(header) + b"".join(sections)
+
+
+def write_binary_report(report: ReviewReport, output_path: str) -> None:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(to_binary(report))
+
+
+class BinaryReport:
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        self._buffer = buffer
+        if len(buffer) < _HEADER.size or not is_binary_report(bytes(buffer[:4])):
+            raise ValueError("Not a binary review report.")
+        (
+            _,
+            version,
+            _,
+            self._meta_offset,
+            self._meta_length,
+            self._strings_offset,
+            self._string_count,
+            self._files_offset,
+            self._file_count,
+            self._columns_offset,
+            self.row_count,
+        ) = _HEADER.unpack_from(buffer)
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary report version: {version}")
+
+        self._blob_offset = self._strings_offset + 8 * (self._string_count + 1)
+        self._strings: dict[int, str] = {}
+        self._meta: dict[str, Any] | None = None
+        self._file_index: dict[str, tuple[int, int]] | None = None
+
+    @classmethod
+    def open(cls, path: str) -> BinaryReport:
+        with open(path, "rb") as handle:
+            # The mapping outlives the file handle; pages are read only when touched.
+            return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> BinaryReport:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _string(self, index: int) -> str | None:
+        if index == _NONE:
+            return None
+        value = self._strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from("<2Q", self._buffer, self._strings_offset + 8 * index)
+            raw = self._buffer[self._blob_offset + start : self._blob_offset + end]
+            value = self._strings[index] = bytes(raw).decode("utf-8")
+        return value
+
+    def summary(self) -> dict[str, Any]:
+        if self._meta is None:
+            raw = self._buffer[self._meta_offset : self._meta_offset + self._meta_length]
+            self._meta = json.loads(bytes(raw).decode("utf-8"))
+        return self._meta
+
+    @property
+    def files(self) -> dict[str, tuple[int, int]]:
+        if self._file_index is None:
+            self._file_index = {}
+            for position in range(self._file_count):
+                string_index, start, count = _FILE_ENTRY.unpack_from(
+                    self._buffer, self._files_offset + position * _FILE_ENTRY.size
+                )
+                self._file_index[self._string(string_index) or ""] = (start, count)
+        return self._file_index
+
+    def _column(self, name: str, start: int, count: int) -> tuple[int, ...]:
+        offset = self._columns_offset + (_COLUMNS.index(name) * self.row_count + start) * 4
+        code = "i" if name == "line" else "I"
+        return struct.unpack_from(f"<{count}{code}", self._buffer, offset)
+
+    def _rows(self, start: int, count: int) -> list[Finding]:
+        values = {name: self._column(name, start, count) for name in _FINDING_COLUMNS}
+        return [
+            Finding(
+                tool=self._string(values["tool"][row]) or "",
+                file_path=self._string(values["file"][row]) or "",
+                line=values["line"][row] if values["line"][row] >= 0 else None,
+                severity=self._string(values["severity"][row]) or "",
+                message=self._string(values["message"][row]) or "",
+                suggestion=self._string(values["suggestion"][row]),
+                rule_id=self._string(values["rule"][row]),
+            )
+            for row in range(count)
+        ]
+
+    def findings_for(self, file_path: str) -> list[Finding]:
+        location = self.files.get(file_path)
+        if location is None:
+            return []
+        return self._rows(*location)
+
+    def findings(self) -> list[Finding]:
+        rows = self._rows(0, self.row_count)
+        # Rows are stored grouped by file; restore the report's original order.
+        order = self._column("order", 0, self.row_count)
+        return [row for _, row in sorted(zip(order, rows), key=lambda pair: pair[0])]
+
+    def to_report(self) -> ReviewReport:
+        meta = self.summary()
+        return ReviewReport(
+            target=meta.get("target", ""),
+            findings=self.findings(),
+            ai_summary=meta.get("ai_summary"),
+            metadata=meta.get("metadata") or {},
+        )
+
+
+def read_report(input_path: str) -> ReviewReport:
+    path = Path(input_path)
+    with path.open("rb") as handle:
+        magic = handle.read(4)
+    if is_binary_report(magic):
+        with BinaryReport.open(str(path)) as binary:
+            return binary.to_report()
+    return from_json(path.read_text(encoding="utf-8"))
@@ -10,6 +10,10 @@ def to_json(report: ReviewReport) -> str:
     return json.dumps(report.to_dict(), indent=2)
 
 
+def from_json(content: str) -> ReviewReport:
+    return ReviewReport.from_dict(json.loads(content))
+
+
 def to_markdown(report: ReviewReport) -> str:
     lines: list[str] = []
     lines.append(f"# Code Review Report: {report.target}")
@@ -3,37 +3,114 @@ from __future__ import annotations
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from code_review_assistant.ai.reviewer import generate_ai_review
+from code_review_assistant.ai.reviewer import generate_ai_review, generate_unit_ai_review
 from code_review_assistant.analyzers.complexity import run_complexity
-from code_review_assistant.analyzers.heuristics import run_bug_risk_heuristics
+from code_review_assistant.analyzers.classification import (
+    POLICY_FULL,
+    POLICY_HEURISTICS,
+    ClassificationPolicy,
+    ClassificationResult,
+    analyze_classified,
+    classify_files,
+)
+from code_review_assistant.analyzers.heuristics import python_files, run_bug_risk_heuristics
 from code_review_assistant.analyzers.static import run_ruff
+from code_review_assistant.baseline import filter_new_findings, load_baseline, write_baseline
 from code_review_assistant.config import get_settings
+from code_review_assistant.distributed import review_sharded
 from code_review_assistant.github.client import GitHubClient
 from code_review_assistant.models import ReviewReport
+from code_review_assistant.scheduling import run_scheduled_analysis
 
 
-def review_local_path(path: str, complexity_threshold: str = "C", use_ai: bool = False) -> ReviewReport:
+def _apply_baseline(report: ReviewReport, path: str, baseline_path: str, update_baseline: bool) -> None:
+    if update_baseline:
+        report.metadata["baseline_fingerprints"] = write_baseline(report.findings, path, baseline_path)
+        return
+
+    if not Path(baseline_path).exists():
+        raise FileNotFoundError(f"Baseline not found: {baseline_path}")
+
+    baseline = load_baseline(baseline_path)
+    new_findings = filter_new_findings(report.findings, path, baseline)
+    report.metadata["baseline_fingerprints"] = len(baseline)
+    report.metadata["baseline_suppressed"] = len(report.findings) - len(new_findings)
+    report.findings = new_findings
+
+
+def review_local_path(
+    path: str,
+    complexity_threshold: str = "C",
+    use_ai: bool = False,
+    baseline_path: str | None = None,
+    update_baseline: bool = False,
+    queue_path: str | None = None,
+    shard_size: int = 50,
+    lease_seconds: float = 300.0,
+    workers: int = 1,
+    classification_policy: ClassificationPolicy | None = None,
+) -> ReviewReport:
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Path not found: {path}")
+
     report = ReviewReport(target=str(Path(path).resolve()))
-    report.add_findings(run_ruff(path))
-    report.add_findings(run_complexity(path, min_grade=complexity_threshold))
-    report.add_findings(run_bug_risk_heuristics(path))
+    classification: ClassificationResult | None = None
+    if queue_path:
+        findings, shard_stats = review_sharded(
+            path,
+            queue_path,
+            complexity_threshold=complexity_threshold,
+            shard_size=shard_size,
+            lease_seconds=lease_seconds,
+            classification_policy=classification_policy,
+        )
+        report.add_findings(findings)
+        report.metadata.update(shard_stats)
+    else:
+        classification = classify_files(python_files(path), classification_policy)
+        report.metadata["classification"] = classification.summary()
+        if workers > 1:
+            findings, schedule_stats = run_scheduled_analysis(
+                classification,
+                complexity_threshold=complexity_threshold,
+                workers=workers,
+                history_path=get_settings().analysis_history_path,
+            )
+            report.add_findings(findings)
+            report.metadata.update(schedule_stats)
+        else:
+            report.add_findings(analyze_classified(classification, min_grade=complexity_threshold))
+
+    if baseline_path:
+        _apply_baseline(report, path, baseline_path, update_baseline)
 
     if use_ai:
         settings = get_settings()
-        report.ai_summary = generate_ai_review(settings=settings, findings=report.findings)
+        if classification is None:
+            classification = classify_files(python_files(path), classification_policy)
+        report.ai_summary, ai_stats = generate_unit_ai_review(
+            settings=settings,
+            py_files=classification.paths(POLICY_FULL) + classification.paths(POLICY_HEURISTICS),
+            findings=report.findings,
+        )
+        report.metadata.update(ai_stats)
 
     return report
 
 
+def build_pr_report(repo: str, pr_number: int, files: list[dict]) -> ReviewReport:
+    return ReviewReport(
+        target=f"https://github.com/{repo}/pull/{pr_number}",
+        metadata={"files_changed": len(files)},
+    )
+
+
 def review_github_pr(repo: str, pr_number: int, use_ai: bool = False) -> ReviewReport:
     settings = get_settings()
     gh = GitHubClient(token=settings.github_token)
     files = gh.fetch_pr_files(repo=repo, pr_number=pr_number)
 
-    report = ReviewReport(
-        target=f"https://github.com/{repo}/pull/{pr_number}",
-        metadata={"files_changed": len(files)},
-    )
+    report = build_pr_report(repo, pr_number, files)
 
     if use_ai:
         report.ai_summary = generate_ai_review(settings=settings, findings=[], changed_files=files)
@@ -64,6 +141,12 @@ def review_code_snippet(
 
         if use_ai:
             settings = get_settings()
-            report.ai_summary = generate_ai_review(settings=settings, findings=report.findings)
+            report.ai_summary, ai_stats = generate_unit_ai_review(
+                settings=settings,
+                py_files=[snippet_path],
+                findings=report.findings,
+                display_paths={snippet_path: filename},
+            )
+            report.metadata.update(ai_stats)
 
         return report
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from code_review_assistant.analyzers.classification import (
+    POLICY_FULL,
+    POLICY_HEURISTICS,
+    ClassificationResult,
+    analyze_files,
+)
+from code_review_assistant.models import Finding
+
+
+# Fallback cost model until a run has been recorded: one ruff + one radon process
+# per task, plus a throughput roughly matching both tools on typical Python.
+TASK_OVERHEAD_SECONDS = 0.15
+SECONDS_PER_BYTE = 2e-6
+
+
+@dataclass
+class AnalysisTask:
+    files: list[Path]
+    estimated_seconds: float
+    file_costs: list[float] = field(default_factory=list)
+
+
+class CostHistory:
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.entries: dict[str, dict[str, float]] = {}
+        self.task_overhead = TASK_OVERHEAD_SECONDS
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries = data["files"]
+            self.task_overhead = float(data["task_overhead"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.entries = {}
+
+    def seconds_per_byte(self) -> float:
+        total_bytes = sum(entry["size"] for entry in self.entries.values())
+        total_seconds = sum(entry["seconds"] for entry in self.entries.values())
+        if total_bytes <= 0 or total_seconds <= 0:
+            return SECONDS_PER_BYTE
+        return total_seconds / total_bytes
+
+    def estimate(self, py_file: Path, size: int, rate: float) -> float:
+        entry = self.entries.get(str(py_file.resolve()))
+        if entry and entry["size"] > 0:
+            return entry["seconds"] * size / entry["size"]
+        return size * rate
+
+    def record(self, py_file: Path, size: int, seconds: float) -> None:
+        self.entries[str(py_file.resolve())] = {"size": size, "seconds": seconds}
+
+    def fit_task_overhead(self, samples: list[tuple[int, float]]) -> None:
+        # Task time is roughly start-up + bytes * rate; the intercept of a least
+        # squares fit over this run's (bytes, seconds) pairs is the start-up cost.
+        if len(samples) < 2:
+            return
+        mean_bytes = sum(size for size, _ in samples) / len(samples)
+        mean_seconds = sum(seconds for _, seconds in samples) / len(samples)
+        variance = sum((size - mean_bytes) ** 2 for size, _ in samples)
+        if variance <= 0:
+            return
+        slope = sum((size - mean_bytes) * (seconds - mean_seconds) for size, seconds in samples) / variance
+        intercept = mean_seconds - max(slope, 0.0) * mean_bytes
+        measured = min(max(intercept, 0.0), min(seconds for _, seconds in samples))
+        self.task_overhead = (self.task_overhead + measured) / 2
+
+    def record_task(self, task: AnalysisTask, seconds: float) -> None:
+        # Start-up is paid once per task and re-added by `plan_tasks`, so only the
+        # remainder is attributed to the task's files.
+        work = max(seconds - self.task_overhead, 0.0)
+        weight = sum(task.file_costs)
+        for path, cost in zip(task.files, task.file_costs):
+            share = cost / weight if weight else 1.0 / len(task.files)
+            self.record(path, path.stat().st_size, work * share)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        payload = {"task_overhead": self.task_overhead, "files": self.entries}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+def plan_tasks(files: list[Path], history: CostHistory, workers: int) -> list[AnalysisTask]:
+    rate = history.seconds_per_byte()
+    costed = sorted(
+        ((history.estimate(py_file, py_file.stat().st_size, rate), py_file) for py_file in files),
+        key=lambda item: item[0],
+        reverse=True,
+    )
+    total = sum(cost for cost, _ in costed)
+
+    overhead = history.task_overhead
+    # Aim for several tasks per worker so the tail can be balanced, but never let a
+    # task cost less than the process start-up it pays for.
+    min_task_cost = max(total / (workers * 8), overhead)
+
+    tasks: list[AnalysisTask] = []
+    batch = AnalysisTask(files=[], estimated_seconds=overhead)
+    for cost, py_file in costed:
+        if cost >= min_task_cost:
+            tasks.append(AnalysisTask([py_file], cost + overhead, [cost]))
+            continue
+        batch.files.append(py_file)
+        batch.file_costs.append(cost)
+        batch.estimated_seconds += cost
+        if batch.estimated_seconds - overhead >= min_task_cost:
+            tasks.append(batch)
+            batch = AnalysisTask(files=[], estimated_seconds=overhead)
+    if batch.files:
+        tasks.append(batch)
+
+    # Longest-processing-time first: idle workers pull the next most expensive task.
+    tasks.sort(key=lambda task: task.estimated_seconds, reverse=True)
+    return tasks
+
+
+def _run_task(full: list[Path], heuristics_only: list[Path], min_grade: str) -> tuple[list[Finding], float, int]:
+    started = time.perf_counter()
+    findings = analyze_files(full, heuristics_only, min_grade=min_grade)
+    return findings, time.perf_counter() - started, os.getpid()
+
+
+def run_scheduled_analysis(
+    classification: ClassificationResult,
+    complexity_threshold: str = "C",
+    workers: int = 2,
+    history_path: str = ".code_review_cache/analysis_times.json",
+) -> tuple[list[Finding], dict[str, Any]]:
+    if workers < 1:
+        raise ValueError("Workers must be at least 1.")
+
+    heuristics_only = set(classification.paths(POLICY_HEURISTICS))
+    files = classification.paths(POLICY_FULL) + classification.paths(POLICY_HEURISTICS)
+    history = CostHistory(history_path)
+    tasks = plan_tasks(files, history, workers)
+
+    findings: list[Finding] = []
+    completed: list[tuple[AnalysisTask, float]] = []
+    busy_by_worker: dict[int, float] = {}
+    actual_seconds = 0.0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # The pool hands tasks to whichever worker frees up first, so submitting in
+        # LPT order gives dynamic, work-stealing style balancing of the tail.
+        futures = {
+            executor.submit(
+                _run_task,
+                [path for path in task.files if path not in heuristics_only],
+                [path for path in task.files if path in heuristics_only],
+                complexity_threshold,
+            ): task
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            task_findings, seconds, pid = future.result()
+            findings.extend(task_findings)
+            actual_seconds += seconds
+            busy_by_worker[pid] = busy_by_worker.get(pid, 0.0) + seconds
+            completed.append((task, seconds))
+    wall_seconds = time.perf_counter() - started
+
+    history.fit_task_overhead(
+        [(sum(path.stat().st_size for path in task.files), seconds) for task, seconds in completed]
+    )
+    for task, seconds in completed:
+        history.record_task(task, seconds)
+
+    history.save()
+    estimated_seconds = sum(task.estimated_seconds for task in tasks)
+    return findings, {
+        "schedule": {
+            "workers": workers,
+            "files": len(files),
+            "tasks": len(tasks),
+            "estimated_seconds": round(estimated_seconds, 3),
+            "actual_seconds": round(actual_seconds, 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "ideal_wall_seconds": round(actual_seconds / workers, 3),
+            "worker_utilization": round(actual_seconds / (wall_seconds * workers), 3) if wall_seconds else 0.0,
+            "worker_busy_seconds": [round(value, 3) for value in sorted(busy_by_worker.values(), reverse=True)],
+        }
+    }
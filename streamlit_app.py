@@ -1,66 +1,220 @@
 from __future__ import annotations
 
+import hashlib
 from collections import Counter
+from pathlib import Path
 
 import streamlit as st
 
-from code_review_assistant.ai.chatbot import ask_review_bot
+from code_review_assistant.ai.chatbot import ask_review_bot_reply
+from code_review_assistant.ai.provider import LLMReply, prewarm_ollama, resolve_provider
+from code_review_assistant.analyzers.heuristics import python_files
 from code_review_assistant.config import get_settings
-from code_review_assistant.models import ReviewReport
-from code_review_assistant.reporting.formatter import to_json, to_markdown
+from code_review_assistant.github.client import GitHubClient
+from code_review_assistant.models import Finding, ReviewReport
+from code_review_assistant.reporting.binary import BinaryReport, is_binary_report, to_binary
+from code_review_assistant.reporting.formatter import from_json, to_json, to_markdown
 from code_review_assistant.review_engine import review_code_snippet, review_github_pr, review_local_path
 
 
 st.set_page_config(page_title="AI Code Review Assistant", layout="wide")
 
+PAGE_SIZES = [50, 100, 250, 500]
 
-def _render_metrics(report: ReviewReport) -> None:
-    severities = Counter(item.severity for item in report.findings)
+
+def _path_signature(path: str) -> str:
+    digest = hashlib.sha256()
+    for py_file in sorted(python_files(path)):
+        stat = py_file.stat()
+        digest.update(f"{py_file}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_local_review(
+    path: str,
+    complexity_threshold: str,
+    use_ai: bool,
+    signature: str,
+) -> ReviewReport:
+    # `signature` only keys the cache so edits to any scanned file invalidate it.
+    return review_local_path(path=path, complexity_threshold=complexity_threshold, use_ai=use_ai)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_pr_review(repo: str, pr_number: int, head_sha: str, use_ai: bool) -> ReviewReport:
+    report = review_github_pr(repo=repo, pr_number=pr_number, use_ai=use_ai)
+    report.metadata["head_sha"] = head_sha
+    return report
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_snippet_review(code: str, filename: str, complexity_threshold: str, use_ai: bool) -> ReviewReport:
+    return review_code_snippet(
+        code=code,
+        filename=filename,
+        complexity_threshold=complexity_threshold,
+        use_ai=use_ai,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_uploaded_report(content: bytes) -> ReviewReport:
+    return from_json(content.decode("utf-8"))
+
+
+def _finding_rows(findings: list[Finding]) -> list[dict]:
+    return [
+        {
+            "severity": item.severity,
+            "tool": item.tool,
+            "rule": item.rule_id or "",
+            "file": item.file_path,
+            "line": item.line,
+            "message": item.message,
+            "suggestion": item.suggestion or "",
+        }
+        for item in findings
+    ]
+
+
+def _render_metrics(total: int, severities: dict[str, int]) -> None:
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Findings", len(report.findings))
+    col1.metric("Total Findings", total)
     col2.metric("High", severities.get("high", 0))
     col3.metric("Medium", severities.get("medium", 0))
     col4.metric("Low", severities.get("low", 0))
 
 
+@st.fragment
+def _render_findings_table(rows: list[dict]) -> None:
+    if not rows:
+        st.info("No findings found.")
+        return
+
+    f1, f2, f3, f4 = st.columns(4)
+    severities = f1.multiselect("Severity", sorted({row["severity"] for row in rows}))
+    tools = f2.multiselect("Tool", sorted({row["tool"] for row in rows}))
+    rules = f3.multiselect("Rule", sorted({row["rule"] for row in rows if row["rule"]}))
+    file_query = f4.text_input("File contains", value="")
+
+    filtered = [
+        row
+        for row in rows
+        if (not severities or row["severity"] in severities)
+        and (not tools or row["tool"] in tools)
+        and (not rules or row["rule"] in rules)
+        and (not file_query or file_query in row["file"])
+    ]
+
+    p1, p2 = st.columns([1, 3])
+    page_size = p1.selectbox("Rows per page", PAGE_SIZES, index=1)
+    page_count = max(1, -(-len(filtered) // page_size))
+    page = p2.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1)
+    start = (int(page) - 1) * page_size
+
+    end = min(len(filtered), start + page_size)
+    st.caption(f"Showing {min(len(filtered), start + 1)}-{end} of {len(filtered)} findings")
+    st.dataframe(filtered[start : start + page_size], use_container_width=True, hide_index=True)
+
+
 def _render_report(report: ReviewReport) -> None:
     st.subheader("Review Report")
-    _render_metrics(report)
+    _render_metrics(len(report.findings), Counter(item.severity for item in report.findings))
 
     if report.ai_summary:
         st.markdown("### AI Insights")
         st.markdown(report.ai_summary)
 
     st.markdown("### Findings")
-    if not report.findings:
-        st.info("No findings found.")
-    else:
-        for item in report.findings:
-            with st.expander(f"[{item.severity.upper()}] {item.file_path}:{item.line or '-'} - {item.tool}"):
-                st.write(item.message)
-                if item.suggestion:
-                    st.caption(f"Suggestion: {item.suggestion}")
-                if item.rule_id:
-                    st.caption(f"Rule: {item.rule_id}")
-
-    markdown_report = to_markdown(report)
-    json_report = to_json(report)
-
-    c1, c2 = st.columns(2)
+    _render_findings_table(st.session_state.latest_rows)
+
+    c1, c2, c3 = st.columns(3)
     c1.download_button(
         "Download Markdown",
-        markdown_report,
+        st.session_state.latest_downloads["markdown"],
         file_name="review_report.md",
         mime="text/markdown",
         use_container_width=True,
     )
     c2.download_button(
         "Download JSON",
-        json_report,
+        st.session_state.latest_downloads["json"],
         file_name="review_report.json",
         mime="application/json",
         use_container_width=True,
     )
+    c3.download_button(
+        "Download Binary",
+        st.session_state.latest_downloads["binary"],
+        file_name="review_report.crr",
+        mime="application/octet-stream",
+        use_container_width=True,
+    )
+
+
+def _render_binary_report(binary: BinaryReport) -> ReviewReport:
+    summary = binary.summary()
+    st.subheader("Review Report")
+    st.caption(summary.get("target", ""))
+    _render_metrics(summary["total_findings"], summary["severity_counts"])
+
+    if summary.get("ai_summary"):
+        st.markdown("### AI Insights")
+        st.markdown(summary["ai_summary"])
+
+    st.markdown("### Findings")
+    files = binary.files
+    findings: list[Finding] = []
+    if files:
+        # Only the selected file's rows are decoded, so large reports open instantly.
+        selected = st.selectbox(
+            "File",
+            sorted(files),
+            format_func=lambda path: f"{path} ({files[path][1]} findings)",
+        )
+        findings = binary.findings_for(selected)
+    _render_findings_table(_finding_rows(findings))
+
+    st.download_button(
+        "Download Binary",
+        st.session_state.latest_binary_content,
+        file_name="review_report.crr",
+        mime="application/octet-stream",
+        use_container_width=True,
+    )
+
+    # The bot sees the selected file's findings plus the report-wide counts.
+    return ReviewReport(
+        target=summary.get("target", ""),
+        findings=findings,
+        ai_summary=summary.get("ai_summary"),
+        metadata={
+            **(summary.get("metadata") or {}),
+            "total_findings": summary["total_findings"],
+            "severity_counts": summary["severity_counts"],
+        },
+    )
+
+
+def _timing_caption(timing: dict) -> str:
+    parts = [f"Answered in {timing['wall_seconds']:.2f}s"]
+    if timing.get("load_seconds") is not None:
+        parts.append(f"model load {timing['load_seconds']:.2f}s")
+    if timing.get("prompt_eval_seconds") is not None:
+        tokens = timing.get("prompt_tokens") or 0
+        parts.append(f"prompt eval {timing['prompt_eval_seconds']:.2f}s for {tokens} tokens")
+    return " | ".join(parts)
+
+
+@st.cache_resource(show_spinner="Loading local model...")
+def _prewarm_model(host: str, model: str, keep_alive: str) -> LLMReply:
+    # Arguments only key the resource so the model is warmed once per server process.
+    # Failures raise instead of returning, so they are not cached and the next rerun retries.
+    warm = prewarm_ollama(get_settings())
+    if warm.text:
+        raise RuntimeError(warm.text)
+    return warm
 
 
 def _chat_section(report: ReviewReport) -> None:
@@ -73,11 +227,16 @@ def _chat_section(report: ReviewReport) -> None:
     for message in st.session_state.chat_messages:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
+            if message.get("timing"):
+                st.caption(_timing_caption(message["timing"]))
 
     question = st.chat_input("Ask the bot about this review...")
     if not question:
         return
 
+    history = [
+        {"role": message["role"], "content": message["content"]} for message in st.session_state.chat_messages
+    ]
     st.session_state.chat_messages.append({"role": "user", "content": question})
     with st.chat_message("user"):
         st.markdown(question)
@@ -85,14 +244,29 @@ def _chat_section(report: ReviewReport) -> None:
     settings = get_settings()
     with st.chat_message("assistant"):
         with st.spinner("Thinking..."):
-            answer = ask_review_bot(settings=settings, report=report, question=question)
-        st.markdown(answer)
+            reply = ask_review_bot_reply(settings=settings, report=report, question=question, history=history)
+        st.markdown(reply.text)
+        st.caption(_timing_caption(reply.timing()))
 
-    st.session_state.chat_messages.append({"role": "assistant", "content": answer})
+    st.session_state.chat_messages.append({"role": "assistant", "content": reply.text, "timing": reply.timing()})
 
 
 def _set_latest_report(report: ReviewReport) -> None:
+    st.session_state.latest_binary = None
     st.session_state.latest_report = report
+    st.session_state.latest_rows = _finding_rows(report.findings)
+    st.session_state.latest_downloads = {
+        "markdown": to_markdown(report),
+        "json": to_json(report),
+        "binary": to_binary(report),
+    }
+    st.session_state.chat_messages = []
+
+
+def _set_latest_binary(content: bytes) -> None:
+    st.session_state.latest_report = None
+    st.session_state.latest_binary = BinaryReport(content)
+    st.session_state.latest_binary_content = content
     st.session_state.chat_messages = []
 
 
@@ -104,7 +278,14 @@ def _local_review_tab() -> None:
 
     if st.button("Run Local Review", use_container_width=True):
         try:
-            report = review_local_path(path=path, complexity_threshold=complexity_threshold, use_ai=use_ai)
+            if not Path(path).exists():
+                raise FileNotFoundError(f"Path not found: {path}")
+            report = _cached_local_review(
+                path=str(Path(path).resolve()),
+                complexity_threshold=complexity_threshold,
+                use_ai=use_ai,
+                signature=_path_signature(path),
+            )
             _set_latest_report(report)
             st.success("Review completed.")
         except Exception as exc:
@@ -123,7 +304,8 @@ def _pr_review_tab() -> None:
             return
 
         try:
-            report = review_github_pr(repo=repo, pr_number=int(pr_number), use_ai=use_ai)
+            head_sha = GitHubClient(token=get_settings().github_token).fetch_pr_head_sha(repo, int(pr_number))
+            report = _cached_pr_review(repo=repo, pr_number=int(pr_number), head_sha=head_sha, use_ai=use_ai)
             _set_latest_report(report)
             st.success("PR review completed.")
         except Exception as exc:
@@ -148,7 +330,7 @@ def _snippet_review_tab() -> None:
 
     if st.button("Review Pasted Code", use_container_width=True):
         try:
-            report = review_code_snippet(
+            report = _cached_snippet_review(
                 code=code,
                 filename="snippet.py",
                 complexity_threshold=complexity_threshold,
@@ -160,11 +342,37 @@ def _snippet_review_tab() -> None:
             st.error(f"Snippet review failed: {exc}")
 
 
+def _open_report_tab() -> None:
+    st.markdown("### Open Saved Report")
+    st.caption("Load a JSON or binary (.crr) report produced by the CLI.")
+    uploaded = st.file_uploader("Report file", type=["json", "crr"])
+
+    if uploaded is not None and st.button("Open Report", use_container_width=True):
+        try:
+            content = uploaded.getvalue()
+            if is_binary_report(content):
+                _set_latest_binary(content)
+            else:
+                _set_latest_report(_cached_uploaded_report(content))
+            st.success("Report loaded.")
+        except Exception as exc:
+            st.error(f"Could not open report: {exc}")
+
+
 def main() -> None:
     st.title("AI-Powered Code Review Assistant")
     st.caption("Static analysis + complexity checks + AI-powered review bot")
 
-    local_tab, pr_tab, snippet_tab = st.tabs(["Local Review", "PR Review", "Paste Code"])
+    settings = get_settings()
+    if settings.ollama_prewarm and resolve_provider(settings) == "ollama":
+        try:
+            _prewarm_model(settings.ollama_host, settings.ollama_model, settings.ollama_keep_alive)
+        except RuntimeError as exc:
+            st.sidebar.warning(str(exc))
+        else:
+            st.sidebar.caption(f"`{settings.ollama_model}` kept warm for {settings.ollama_keep_alive}.")
+
+    local_tab, pr_tab, snippet_tab, open_tab = st.tabs(["Local Review", "PR Review", "Paste Code", "Open Report"])
 
     with local_tab:
         _local_review_tab()
@@ -175,10 +383,17 @@ def main() -> None:
     with snippet_tab:
         _snippet_review_tab()
 
+    with open_tab:
+        _open_report_tab()
+
     report = st.session_state.get("latest_report")
-    if report:
+    binary = st.session_state.get("latest_binary")
+    if report or binary:
         st.divider()
-        _render_report(report)
+        if binary:
+            report = _render_binary_report(binary)
+        else:
+            _render_report(report)
         st.divider()
         _chat_section(report)
     else:
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from code_review_assistant.baseline import filter_new_findings, load_baseline, write_baseline
+from code_review_assistant.models import Finding
+
+
+def _finding(file_path: Path, line: int) -> Finding:
+    return Finding(
+        tool="heuristic",
+        file_path=str(file_path),
+        line=line,
+        severity="high",
+        message="Use of `eval` may introduce security risks.",
+        rule_id="HR002",
+    )
+
+
+def test_baseline_survives_line_shifts_and_reports_new_findings(tmp_path: Path) -> None:
+    sample = tmp_path / "sample.py"
+    sample.write_text("x = eval('1')\n", encoding="utf-8")
+    baseline_file = tmp_path / "review.baseline"
+
+    assert write_baseline([_finding(sample, 1)], str(tmp_path), str(baseline_file)) == 1
+
+    sample.write_text("import os\n\n    x  =  eval('1')\ny = eval('2')\n", encoding="utf-8")
+    baseline = load_baseline(str(baseline_file))
+    new_findings = filter_new_findings([_finding(sample, 3), _finding(sample, 4)], str(tmp_path), baseline)
+
+    assert len(baseline) == 1
+    assert [item.line for item in new_findings] == [4]
+
+
+def test_baseline_reports_additional_identical_lines(tmp_path: Path) -> None:
+    sample = tmp_path / "sample.py"
+    sample.write_text("x = eval('1')\n", encoding="utf-8")
+    baseline_file = tmp_path / "review.baseline"
+    write_baseline([_finding(sample, 1)], str(tmp_path), str(baseline_file))
+
+    sample.write_text("x = eval('1')\nx = eval('1')\n", encoding="utf-8")
+    baseline = load_baseline(str(baseline_file))
+    new_findings = filter_new_findings([_finding(sample, 1), _finding(sample, 2)], str(tmp_path), baseline)
+
+    assert len(new_findings) == 1
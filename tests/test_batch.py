@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from code_review_assistant import batch
+from code_review_assistant.batch import (
+    BatchReviewSummary,
+    PRReviewResult,
+    parse_pr_ref,
+    review_github_prs,
+    summary_to_markdown,
+)
+from code_review_assistant.models import ReviewReport
+
+
+class StubGitHubClient:
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def __init__(self, token=None) -> None:
+        self.token = token
+
+    def _call(self) -> None:
+        with self.lock:
+            StubGitHubClient.in_flight += 1
+            StubGitHubClient.max_in_flight = max(StubGitHubClient.max_in_flight, StubGitHubClient.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            StubGitHubClient.in_flight -= 1
+
+    def list_open_prs(self, repo: str) -> list[int]:
+        self._call()
+        if repo == "acme/missing":
+            raise RuntimeError("404 Not Found")
+        return [1, 2, 3]
+
+    def fetch_pr_files(self, repo: str, pr_number: int) -> list[dict]:
+        self._call()
+        if pr_number == 3:
+            raise RuntimeError("502 Bad Gateway")
+        return [{"filename": "app.py", "status": "modified"}]
+
+
+def test_parse_pr_ref() -> None:
+    assert parse_pr_ref("acme/api#42") == ("acme/api", 42)
+    for value in ["acme/api", "acme#42", "acme/api#x", "acme/api#"]:
+        with pytest.raises(ValueError):
+            parse_pr_ref(value)
+
+
+def test_batch_isolates_failures_dedupes_and_bounds_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch, "GitHubClient", StubGitHubClient)
+    StubGitHubClient.max_in_flight = 0
+
+    summary = review_github_prs(
+        pr_refs=[("acme/api", 1), ("acme/web", 7)],
+        repos=["acme/api", "acme/missing"],
+        github_concurrency=2,
+    )
+
+    assert [(item.repo, item.pr_number) for item in summary.results] == [
+        ("acme/api", 1),
+        ("acme/web", 7),
+        ("acme/api", 2),
+        ("acme/api", 3),
+    ]
+    assert [item.ok for item in summary.results] == [True, True, True, False]
+    assert summary.listing_errors == {"acme/missing": "404 Not Found"}
+    assert not summary.ok
+    assert StubGitHubClient.max_in_flight == 2
+
+
+def test_summary_reports_failed_prs_and_listings() -> None:
+    summary = BatchReviewSummary(
+        results=[
+            PRReviewResult("acme/api", 1, report=ReviewReport(target="pr1", metadata={"files_changed": 2})),
+            PRReviewResult("acme/api", 3, error="502 Bad Gateway"),
+        ],
+        listing_errors={"acme/missing": "404 Not Found"},
+        github_concurrency=2,
+        llm_concurrency=1,
+    )
+
+    data = summary.to_dict()
+    assert (data["total_prs"], data["succeeded"], data["failed"]) == (2, 1, 1)
+    assert data["listing_errors"] == {"acme/missing": "404 Not Found"}
+    assert data["results"][1] == {
+        "repo": "acme/api",
+        "pr_number": 3,
+        "ok": False,
+        "error": "502 Bad Gateway",
+        "elapsed_seconds": 0.0,
+        "files_changed": None,
+        "total_findings": 0,
+        "high": 0,
+        "medium": 0,
+        "low": 0,
+    }
+
+    markdown = summary_to_markdown(summary)
+    assert "- Failed: 1" in markdown
+    assert "- `acme/missing`: 404 Not Found" in markdown
+    assert "- `acme/api#3`: FAILED - 502 Bad Gateway" in markdown
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from code_review_assistant.models import Finding, ReviewReport
+from code_review_assistant.reporting.binary import BinaryReport, read_report, write_binary_report
+from code_review_assistant.reporting.formatter import to_json
+
+
+def _report() -> ReviewReport:
+    return ReviewReport(
+        target="/repo",
+        findings=[
+            Finding("heuristic", "a.py", 3, "high", "Bare `except:` can hide unexpected failures.", rule_id="HR001"),
+            Finding("ruff", "b.py", None, "medium", "Unused import", suggestion="Remove import", rule_id="F401"),
+            Finding("heuristic", "a.py", 9, "high", "Use of `eval` may introduce security risks.", rule_id="HR002"),
+        ],
+        ai_summary="- Fix the bare except.",
+        metadata={"files_changed": 2},
+    )
+
+
+def test_binary_report_summary_and_lazy_file_lookup(tmp_path: Path) -> None:
+    output = tmp_path / "review.crr"
+    write_binary_report(_report(), str(output))
+
+    with BinaryReport.open(str(output)) as binary:
+        summary = binary.summary()
+        assert summary["total_findings"] == 3
+        assert summary["severity_counts"] == {"high": 2, "medium": 1}
+        assert summary["rule_counts"]["HR001"] == 1
+        assert list(binary.files) == ["a.py", "b.py"]
+        assert [item.rule_id for item in binary.findings_for("a.py")] == ["HR001", "HR002"]
+        assert binary.findings_for("b.py")[0].line is None
+
+
+def test_binary_round_trip_matches_json(tmp_path: Path) -> None:
+    output = tmp_path / "review.crr"
+    json_output = tmp_path / "review.json"
+    report = _report()
+    write_binary_report(report, str(output))
+    json_output.write_text(to_json(report), encoding="utf-8")
+
+    from_binary = read_report(str(output))
+    from_json = read_report(str(json_output))
+
+    assert from_json == report
+    assert from_binary.findings == report.findings
+    assert from_binary.ai_summary == report.ai_summary
+    assert from_binary.metadata == report.metadata
@@ -0,0 +1,58 @@
+import pytest
+
+from code_review_assistant.ai import chatbot
+from code_review_assistant.ai.provider import LLMReply, _keep_alive
+from code_review_assistant.config import Settings
+from code_review_assistant.models import Finding, ReviewReport
+
+
+def _report() -> ReviewReport:
+    return ReviewReport(
+        target="/repo",
+        findings=[Finding("heuristic", "a.py", 3, "high", "Bare `except:`", rule_id="HR001")],
+        ai_summary="- Fix the bare except.",
+        metadata={"files_changed": 1, "classification": {"files_total": 4}},
+    )
+
+
+def test_chat_prefix_is_stable_across_turns(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict] = []
+
+    def fake_reply(settings: Settings, system_prompt: str, user_prompt: str, history: list[dict]) -> LLMReply:
+        calls.append({"system": system_prompt, "user": user_prompt, "history": history})
+        return LLMReply(text="answer", provider="ollama")
+
+    monkeypatch.setattr(chatbot, "generate_llm_reply", fake_reply)
+    settings = Settings()
+    chatbot.ask_review_bot(settings, _report(), "What first?")
+    chatbot.ask_review_bot(
+        settings,
+        _report(),
+        "And then?",
+        history=[{"role": "user", "content": "What first?"}, {"role": "assistant", "content": "answer"}],
+    )
+
+    assert calls[0]["system"] == calls[1]["system"] == chatbot.build_chat_prefix(_report())
+    assert "What first?" not in calls[0]["system"]
+    assert calls[1]["user"] == "Developer question: And then?"
+    assert calls[1]["history"] == [
+        {"role": "user", "content": "Developer question: What first?"},
+        {"role": "assistant", "content": "answer"},
+    ]
+
+
+def test_history_messages_prefix_only_user_turns() -> None:
+    assert chatbot._history_messages(None) == []
+    assert chatbot._history_messages(
+        [{"role": "user", "content": "Why?", "timing": {}}, {"role": "assistant", "content": "Because."}]
+    ) == [
+        {"role": "user", "content": "Developer question: Why?"},
+        {"role": "assistant", "content": "Because."},
+    ]
+
+
+def test_keep_alive_parses_seconds_and_passes_durations_through() -> None:
+    assert _keep_alive(Settings(ollama_keep_alive="-1")) == -1
+    assert _keep_alive(Settings(ollama_keep_alive="600")) == 600
+    assert _keep_alive(Settings(ollama_keep_alive="30m")) == "30m"
+    assert _keep_alive(Settings(ollama_keep_alive=" 1h ")) == "1h"
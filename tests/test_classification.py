@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from code_review_assistant.analyzers.classification import (
+    POLICY_FULL,
+    POLICY_HEURISTICS,
+    POLICY_SKIP,
+    ClassificationPolicy,
+    analyze_classified,
+    classify_files,
+    is_generated,
+)
+
+
+def test_classifies_generated_and_large_files(tmp_path: Path) -> None:
+    regular = tmp_path / "service.py"
+    regular.write_text("def run(a=[]):\n    return a\n", encoding="utf-8")
+    copy = tmp_path / "vendored_service.py"
+    copy.write_text(regular.read_text(encoding="utf-8"), encoding="utf-8")
+    generated = tmp_path / "models.py"
+    generated.write_text("# Code generated by sqlc. DO NOT EDIT.\nx = 1\n", encoding="utf-8")
+    proto = tmp_path / "api_pb2.py"
+    proto.write_text("y = 2\n", encoding="utf-8")
+    large = tmp_path / "tables.py"
+    large.write_text("z = 3\n" * 100, encoding="utf-8")
+    empty = tmp_path / "__init__.py"
+    empty.write_text("", encoding="utf-8")
+    mentions = tmp_path / "markers.py"
+    mentions.write_text('"""Marker helpers."""\nMARKERS = ("@generated", "DO NOT EDIT")\n', encoding="utf-8")
+
+    result = classify_files(
+        [regular, copy, generated, proto, large, empty, mentions],
+        ClassificationPolicy(max_full_bytes=200, max_bytes=10_000),
+    )
+    policies = {item.path.name: item.policy for item in result.files}
+
+    assert policies == {
+        "service.py": POLICY_FULL,
+        "vendored_service.py": POLICY_FULL,
+        "models.py": POLICY_SKIP,
+        "api_pb2.py": POLICY_SKIP,
+        "tables.py": POLICY_HEURISTICS,
+        "__init__.py": POLICY_FULL,
+        "markers.py": POLICY_FULL,
+    }
+    summary = result.summary()
+    assert summary["files_skipped"] == 2
+    assert summary["bytes_saved"] == generated.stat().st_size + proto.stat().st_size
+
+    findings = analyze_classified(result)
+    hr003_files = sorted(Path(item.file_path).name for item in findings if item.rule_id == "HR003")
+    assert hr003_files == ["service.py", "vendored_service.py"]
+
+
+def test_identical_files_keep_path_specific_results(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.ruff]\nextend-exclude = ["a_vendor"]\n', encoding="utf-8")
+    vendored = tmp_path / "a_vendor" / "util.py"
+    app = tmp_path / "app" / "util.py"
+    for path in (vendored, app):
+        path.parent.mkdir()
+        path.write_text("import os\n", encoding="utf-8")
+
+    findings = analyze_classified(classify_files([vendored, app]))
+
+    assert [Path(item.file_path).resolve() for item in findings if item.rule_id == "F401"] == [app.resolve()]
+
+
+def test_generated_detection_only_matches_tool_headers() -> None:
+    generated_headers = [
+        b"# @generated by pants\nx = 1\n",
+        b"# -*- coding: utf-8 -*-\n# Generated by the protocol buffer compiler.  DO NOT EDIT!\n# source: api.proto\n",
+        b"#!/usr/bin/env python\n# Code generated by sqlc. DO NOT EDIT.\n",
+    ]
+    handwritten_headers = [
+        b'"""Helpers for parsing auto-generated request IDs."""\n',
+        b"# Do not edit the constants below without updating docs.\nLIMIT = 3\n",
+        b'"""@generated\n\nCode generated by hand. DO NOT EDIT.\n"""\n',
+        b"import os\n# @generated\n",
+        b"# Code generated by sqlc. DO NOT EDIT. Really.\n",
+    ]
+
+    assert all(is_generated(Path("module.py"), header) for header in generated_headers)
+    assert not any(is_generated(Path("module.py"), header) for header in handwritten_headers)
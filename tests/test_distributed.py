@@ -0,0 +1,74 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from code_review_assistant import distributed
+from code_review_assistant.distributed import WorkQueue, process_one
+from code_review_assistant.models import Finding
+
+
+def test_expired_lease_is_reclaimed_and_results_merge(tmp_path: Path) -> None:
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=-1)
+    job_id = queue.create_job(str(tmp_path), "C", [["a.py"], ["b.py"]])
+
+    crashed = queue.claim("worker-1", job_id=job_id)
+    reclaimed = queue.claim("worker-2", job_id=job_id)
+    assert crashed is not None and reclaimed is not None
+    assert reclaimed.shard_id == crashed.shard_id
+
+    queue.lease_seconds = 300
+    queue.complete(reclaimed, "worker-2", [Finding("heuristic", "a.py", 1, "high", "Bare `except:`", rule_id="HR001")])
+    other = queue.claim("worker-2", job_id=job_id)
+    assert other is not None and other.files == ["b.py"]
+    queue.complete(other, "worker-2", [])
+
+    findings, _, errors = queue.results(job_id)
+    assert errors == []
+    assert [item.rule_id for item in findings] == ["HR001"]
+    assert queue.progress(job_id) == {"done": 2}
+
+
+def test_stale_worker_cannot_fail_reclaimed_shard(tmp_path: Path) -> None:
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=-1, max_attempts=2)
+    job_id = queue.create_job(str(tmp_path), "C", [["a.py"]])
+
+    stale = queue.claim("worker-1", job_id=job_id)
+    queue.lease_seconds = 300
+    owner = queue.claim("worker-2", job_id=job_id)
+    assert stale is not None and owner is not None
+
+    queue.fail(stale, "worker-1", "worker-1: crashed late")
+    assert queue.progress(job_id) == {"claimed": 1}
+
+    assert not queue.complete(stale, "worker-1", [])
+    assert queue.progress(job_id) == {"claimed": 1}
+    assert queue.complete(owner, "worker-2", [])
+    findings, _, errors = queue.results(job_id)
+    assert (findings, errors) == ([], [])
+
+
+def test_slow_worker_keeps_its_lease(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=0.15)
+    job_id = queue.create_job(str(tmp_path), "C", [["a.py"]])
+    runs: list[str] = []
+
+    def slow_analysis(classification, min_grade="C"):
+        runs.append("run")
+        time.sleep(0.6)
+        return []
+
+    monkeypatch.setattr(distributed, "analyze_classified", slow_analysis)
+    worker = threading.Thread(target=process_one, args=(queue, "worker-1", job_id))
+    worker.start()
+    while not runs:
+        time.sleep(0.01)
+    while worker.is_alive():
+        assert queue.claim("worker-2", job_id=job_id) is None
+        time.sleep(0.05)
+    worker.join()
+
+    assert runs == ["run"]
+    assert queue.progress(job_id) == {"done": 1}
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from code_review_assistant.scheduling import CostHistory, plan_tasks
+
+
+def test_plan_tasks_runs_large_files_first_and_batches_tiny_files(tmp_path: Path) -> None:
+    big = tmp_path / "generated.py"
+    big.write_text("x = 1\n" * 200_000, encoding="utf-8")
+    tiny = []
+    for index in range(20):
+        path = tmp_path / f"tiny_{index}.py"
+        path.write_text("y = 2\n", encoding="utf-8")
+        tiny.append(path)
+
+    history = CostHistory(str(tmp_path / "history.json"))
+    tasks = plan_tasks([*tiny, big], history, workers=4)
+
+    assert tasks[0].files == [big]
+    assert len(tasks) < 5
+    assert sorted(path for task in tasks for path in task.files) == sorted([*tiny, big])
+
+
+def test_recorded_times_override_size_estimate(tmp_path: Path) -> None:
+    slow = tmp_path / "slow.py"
+    slow.write_text("z = 3\n", encoding="utf-8")
+    history = CostHistory(str(tmp_path / "history.json"))
+    history.record(slow, slow.stat().st_size, 5.0)
+    history.save()
+
+    reloaded = CostHistory(str(tmp_path / "history.json"))
+    assert reloaded.estimate(slow, slow.stat().st_size, rate=1e-9) == 5.0
+
+
+def test_recorded_history_does_not_inflate_later_plans(tmp_path: Path) -> None:
+    files = []
+    for index in range(21):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text("def f(x):\n    return x\n" * (index + 1) * 20, encoding="utf-8")
+        files.append(path)
+    history = CostHistory(str(tmp_path / "history.json"))
+
+    first = plan_tasks(files, history, workers=3)
+    plan = first
+    for _ in range(3):
+        # Each task takes exactly its estimate, start-up overhead included.
+        for task in plan:
+            history.record_task(task, task.estimated_seconds)
+        plan = plan_tasks(files, history, workers=3)
+
+    assert len(plan) <= len(first)
+    assert sum(task.estimated_seconds for task in plan) <= sum(task.estimated_seconds for task in first) + 1e-9
+
+
+def test_task_overhead_is_fitted_from_task_times(tmp_path: Path) -> None:
+    history = CostHistory(str(tmp_path / "history.json"))
+    history.task_overhead = 0.4
+    history.fit_task_overhead([(1000, 0.5), (3000, 0.7), (5000, 0.9)])
+    history.save()
+
+    assert abs(CostHistory(str(tmp_path / "history.json")).task_overhead - 0.4) < 1e-9
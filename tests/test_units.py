@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from code_review_assistant.ai import reviewer
+from code_review_assistant.ai.units import UnitReviewCache, extract_units
+from code_review_assistant.config import Settings
+from code_review_assistant.models import Finding
+
+
+def test_unit_digest_ignores_formatting_and_tracks_code_changes(tmp_path: Path) -> None:
+    sample = tmp_path / "sample.py"
+    original = extract_units(sample, "def add(a, b):\n    return a + b\n\n\nclass Box:\n    size = 1\n")
+    reformatted = extract_units(
+        sample,
+        "import os\n\n# helpers\ndef add(a,  b):  # sum\n\n    return a+b\n\nclass Box:\n    size = 1\n",
+    )
+    modified = extract_units(sample, "def add(a, b):\n    return a - b\n\n\nclass Box:\n    size = 1\n")
+
+    assert [unit.name for unit in original] == ["add", "Box"]
+    assert [unit.digest for unit in original] == [unit.digest for unit in reformatted]
+    assert original[0].digest != modified[0].digest
+    assert original[1].digest == modified[1].digest
+
+
+def test_unit_review_cache_round_trip(tmp_path: Path) -> None:
+    cache = UnitReviewCache(str(tmp_path), "ollama:llama3.1:8b")
+
+    assert cache.get("abc") is None
+    cache.put("abc", "- No issues.")
+    assert cache.get("abc") == "- No issues."
+    assert UnitReviewCache(str(tmp_path), "openai:gpt-4o-mini").get("abc") is None
+
+
+def test_unit_review_sends_only_uncached_units_and_defers_over_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sample = tmp_path / "sample.py"
+    sample.write_text(
+        "import os\nos.system('ls')\n\n\ndef add(a, b):\n    return a + b\n\n\ndef risky():\n    eval('1')\n",
+        encoding="utf-8",
+    )
+    findings = [
+        Finding("heuristic", str(sample), 10, "high", "Use of `eval` may introduce security risks.", rule_id="HR002"),
+        Finding("ruff", str(sample), 2, "medium", "Module-level call", rule_id="S605"),
+    ]
+    prompts: list[dict] = []
+    failing = False
+
+    def fake_llm(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+        prompts.append(json.loads(user_prompt))
+        if failing:
+            return "Ollama request failed. offline"
+        return f"- Review of {prompts[-1]['unit']}" if "unit" in prompts[-1] else "- Avoid os.system."
+
+    monkeypatch.setattr(reviewer, "generate_llm_response", fake_llm)
+    settings = Settings(ai_cache_dir=str(tmp_path / "cache"), ai_max_units=1)
+    risky = "- Review of sample.py:9 function `risky`"
+
+    summary, stats = reviewer.generate_unit_ai_review(settings, [sample], findings, {sample: "sample.py"})
+    assert [prompt.get("unit") for prompt in prompts] == ["sample.py:9 function `risky`", None]
+    assert [item["rule_id"] for item in prompts[1]["findings"]] == ["S605"]
+    assert stats["ai_units_sent"] == 1 and stats["ai_units_deferred"] == 1
+    assert stats["ai_findings_outside_units"] == 1
+    assert f"### sample.py:9 function `risky`\n{risky}" in summary
+    assert "### Other findings\n- Avoid os.system." in summary
+
+    prompts.clear()
+    summary, stats = reviewer.generate_unit_ai_review(settings, [sample], findings, {sample: "sample.py"})
+    assert [prompt.get("unit") for prompt in prompts] == ["sample.py:5 function `add`"]
+    assert stats["ai_units_cached"] == 1 and stats["ai_units_sent"] == 1 and stats["ai_units_deferred"] == 0
+    assert risky in summary and "- Review of sample.py:5 function `add`" in summary
+
+    sample.write_text(sample.read_text(encoding="utf-8") + "\n\ndef sub(a, b):\n    return a - b\n", encoding="utf-8")
+    prompts.clear()
+    failing = True
+    summary, stats = reviewer.generate_unit_ai_review(settings, [sample], findings, {sample: "sample.py"})
+    assert [prompt.get("unit") for prompt in prompts] == ["sample.py:13 function `sub`"]
+    assert risky in summary and "- Avoid os.system." in summary
+    assert summary.endswith("Ollama request failed. offline")
+    assert stats["ai_units_sent"] == 0 and stats["ai_units_deferred"] == 1
+
+    failing = False
+    prompts.clear()
+    reviewer.generate_unit_ai_review(settings, [sample], findings, {sample: "sample.py"})
+    assert [prompt.get("unit") for prompt in prompts] == ["sample.py:13 function `sub`"]
+
+
+def test_unit_review_cache_follows_resolved_provider(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sample = tmp_path / "sample.py"
+    sample.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    prompts: list[str] = []
+
+    def fake_llm(settings: Settings, system_prompt: str, user_prompt: str) -> str:
+        prompts.append(user_prompt)
+        return "- No issues."
+
+    monkeypatch.setattr(reviewer, "generate_llm_response", fake_llm)
+    cache_dir = str(tmp_path / "cache")
+
+    local = Settings(llm_provider="auto", openai_api_key=None, ai_cache_dir=cache_dir)
+    hosted = Settings(llm_provider="auto", openai_api_key="sk-test", ai_cache_dir=cache_dir)
+    explicit = Settings(llm_provider="openai", openai_api_key="sk-test", ai_cache_dir=cache_dir)
+    reviewer.generate_unit_ai_review(local, [sample], [])
+    reviewer.generate_unit_ai_review(hosted, [sample], [])
+    reviewer.generate_unit_ai_review(explicit, [sample], [])
+
+    assert len(prompts) == 2